@@ -8,6 +8,7 @@ All bridging functionality is now handled by the unified games table.
 """
 
 import random
+import numpy as np
 from fastapi import APIRouter, HTTPException, Depends, Query
 from app.models import (
     CreateBridgingGameRequest, CreateBridgingGameResponse,
@@ -26,7 +27,7 @@ from app.routes.games import (
     submit_bridging_bridge as games_submit_bridge,
 )
 from app.services.cache import VocabularyPool
-from app.services.scoring import cosine_similarity
+from app.services.scoring import cosine_similarity, similarity_matrix
 
 router = APIRouter()
 
@@ -70,19 +71,12 @@ async def suggest_distant_word(
                 all_words = [from_word_clean] + candidates
                 embeddings = await cache.get_embeddings_batch(all_words)
 
-                from_embedding = embeddings[0]
-                candidate_embeddings = embeddings[1:]
-
-                # Find the most distant candidate (lowest similarity)
-                best_word = candidates[0]
-                best_distance = -1.0
-
-                for word, emb in zip(candidates, candidate_embeddings):
-                    sim = cosine_similarity(from_embedding, emb)
-                    distance = 1 - sim
-                    if distance > best_distance:
-                        best_distance = distance
-                        best_word = word
+                # Score all candidates against from_word in one (1, N)
+                # similarity matrix and take the most distant (lowest
+                # similarity; first wins on ties)
+                embedding_matrix = np.asarray(embeddings, dtype=np.float32)
+                sims = similarity_matrix(embedding_matrix[:1], embedding_matrix[1:])[0]
+                best_word = candidates[int(np.argmin(sims))]
 
                 return SuggestWordResponse(
                     suggestion=best_word,
@@ -228,14 +228,11 @@ def _parse_embedding(raw) -> list[float]:
 
 async def _get_vocab_embeddings_matrix():
     """Get vocabulary embeddings as numpy array for scoring."""
-    import numpy as np
     pool = VocabularyPool.get_instance()
     if not pool.is_initialized or pool.size == 0:
         return None
-    items = pool.get_random_with_embeddings(pool.size)
-    if not items:
-        return None
-    return np.array([emb for _, emb in items])
+    _, matrix = pool.get_embedding_matrix()
+    return matrix
 
 
 async def _get_peer_responses(supabase, slug: str, user_id: str, source_item: int, config_item: dict) -> dict:
@@ -884,8 +881,10 @@ async def submit_game(
 
         if vocab_matrix is not None:
             foil_sets = get_or_create_foil_sets(slug, m, vocab_matrix, k=100, seed=42)
+            # Pool rows are unit-normalized at load time
             scores = score_study_bridge(
-                target_embeddings, word_embeddings, foil_sets, vocab_matrix
+                target_embeddings, word_embeddings, foil_sets, vocab_matrix,
+                vocab_normalized=True
             )
         else:
             scores = {"divergence": calculate_spread_clues_only(word_embeddings_list)}
@@ -8,6 +8,7 @@ Components:
 - VocabularyPool: In-memory vocabulary for instant random selection
 - StatsCache: Pre-computed null distributions for percentile calculations
 - NoiseFloorCache: LRU cache for noise floor results (eliminates repeated computations)
+- LexicalUnionCache: LRU cache for statistical union results (repeated anchor-target pairs)
 
 Usage:
     from app.services.cache import EmbeddingCache, VocabularyPool, NoiseFloorCache
@@ -24,11 +25,16 @@ Usage:
     # Noise floor cache (singleton)
     nf_cache = NoiseFloorCache.get_instance()
     cached = nf_cache.get(seed_word)
+
+    # Lexical union cache (singleton)
+    union_cache = LexicalUnionCache.get_instance()
+    cached = union_cache.get(anchor, target, num_concepts)
 """
 
 from app.services.cache.embedding_cache import EmbeddingCache
 from app.services.cache.vocabulary_pool import VocabularyPool
 from app.services.cache.stats_cache import StatsCache
 from app.services.cache.noise_floor_cache import NoiseFloorCache
+from app.services.cache.lexical_union_cache import LexicalUnionCache
 
-__all__ = ["EmbeddingCache", "VocabularyPool", "StatsCache", "NoiseFloorCache"]
+__all__ = ["EmbeddingCache", "VocabularyPool", "StatsCache", "NoiseFloorCache", "LexicalUnionCache"]
@@ -0,0 +1,162 @@
+"""
+LexicalUnionCache - LRU Cache for Statistical Union Results
+
+Caches find_lexical_union() results so repeated anchor-target pairs
+(the same puzzle served to many participants) skip the embedding call,
+the pgvector union search, and the morphological filtering.
+
+Performance Impact:
+- Cache hit: <1ms (vs 0.5-2s embedding + RPC + filtering)
+- Memory: ~0.5KB per entry (≤10 words)
+- Default max: 2,000 entries = ~1MB memory
+
+Usage:
+    cache = LexicalUnionCache.get_instance()
+
+    # Check cache first
+    cached = cache.get(anchor, target, num_concepts)
+    if cached is not None:
+        return cached
+
+    # Compute union...
+    union_words = await compute_union(...)
+
+    # Store in cache
+    cache.put(anchor, target, num_concepts, union_words)
+"""
+
+import time
+from typing import Optional
+from collections import OrderedDict
+from threading import Lock
+
+
+class LexicalUnionCache:
+    """Thread-safe LRU cache for lexical union results with TTL expiration."""
+
+    _instance: Optional["LexicalUnionCache"] = None
+    _lock = Lock()
+
+    # Configuration
+    DEFAULT_MAX_SIZE = 2_000  # Max cached unions
+    DEFAULT_TTL_SECONDS = 3600  # 1 hour TTL (matches vocabulary refresh)
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS
+    ):
+        """
+        Initialize the lexical union cache.
+
+        Args:
+            max_size: Maximum number of unions to cache
+            ttl_seconds: Time-to-live for cache entries in seconds
+        """
+        # Key: (anchor, target, num_concepts)
+        # Value: (union_words, timestamp)
+        self._cache: OrderedDict[tuple, tuple[list[str], float]] = OrderedDict()
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._hits = 0
+        self._misses = 0
+        self._cache_lock = Lock()
+
+    @classmethod
+    def get_instance(cls) -> "LexicalUnionCache":
+        """Get the singleton instance of LexicalUnionCache."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Reset the singleton (for testing)."""
+        with cls._lock:
+            cls._instance = None
+
+    def _make_key(self, anchor: str, target: str, num_concepts: int) -> tuple:
+        """Create a hashable cache key (direction matters: anchor → target)."""
+        return (anchor.lower().strip(), target.lower().strip(), num_concepts)
+
+    def _is_expired(self, timestamp: float) -> bool:
+        """Check if a cache entry has expired."""
+        return time.time() - timestamp > self._ttl_seconds
+
+    def get(self, anchor: str, target: str, num_concepts: int) -> Optional[list[str]]:
+        """
+        Get union words from cache if present and not expired.
+
+        Args:
+            anchor: The anchor concept
+            target: The target concept
+            num_concepts: Number of union concepts requested
+
+        Returns:
+            Copy of the cached union words, or None if not in cache
+        """
+        key = self._make_key(anchor, target, num_concepts)
+
+        with self._cache_lock:
+            if key in self._cache:
+                result, timestamp = self._cache[key]
+                if not self._is_expired(timestamp):
+                    # Move to end (most recently used)
+                    self._cache.move_to_end(key)
+                    self._hits += 1
+                    return list(result)
+                else:
+                    # Expired, remove it
+                    del self._cache[key]
+            self._misses += 1
+            return None
+
+    def put(
+        self,
+        anchor: str,
+        target: str,
+        num_concepts: int,
+        union_words: list[str]
+    ) -> None:
+        """
+        Add union result to cache.
+
+        Args:
+            anchor: The anchor concept
+            target: The target concept
+            num_concepts: Number of union concepts requested
+            union_words: The computed union words
+        """
+        key = self._make_key(anchor, target, num_concepts)
+
+        with self._cache_lock:
+            if key in self._cache:
+                # Overwrite in place (most recently used); nothing to evict
+                self._cache.move_to_end(key)
+            else:
+                # Remove oldest if at capacity
+                while len(self._cache) >= self._max_size:
+                    self._cache.popitem(last=False)
+
+            self._cache[key] = (list(union_words), time.time())
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        with self._cache_lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._cache),
+                "max_size": self._max_size,
+                "hit_rate": self._hits / total if total > 0 else 0,
+            }
+
+    def clear(self) -> None:
+        """Clear all cached unions (e.g. after a vocabulary rebuild)."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
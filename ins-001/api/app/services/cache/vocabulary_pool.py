@@ -20,15 +20,28 @@ Usage:
 
     # Get random words with embeddings (for bootstrap sampling)
     samples = pool.get_random_with_embeddings(100)
+
+    # Full vocabulary as one contiguous float32 (N, 1536) matrix
+    words, matrix = pool.get_embedding_matrix()
 """
 
 import random
 import asyncio
 import json
+import numpy as np
 from typing import Optional
 from threading import Lock
 from datetime import datetime, timedelta
 
+from app.services.cache.lexical_union_cache import LexicalUnionCache
+
+# Optional fast JSON parser for embedding strings (stdlib json if missing)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class VocabularyPool:
     """In-memory vocabulary for instant random word selection."""
@@ -39,11 +52,20 @@ class VocabularyPool:
     # Configuration
     REFRESH_INTERVAL_HOURS = 1
     DEFAULT_VOCABULARY_SIZE = 50_000
+    # Storage dtype for the embedding matrix. float32 is what the scoring
+    # kernels consume directly; float16 halves memory (~90MB for 30K words)
+    # at ~3 significant digits, but scoring then upcasts a copy per call.
+    EMBEDDING_DTYPE = np.float32
+    MAX_CONCURRENT_PAGES = 8  # Page requests in flight during initialize()
 
     def __init__(self):
         """Initialize the vocabulary pool (empty until initialized)."""
         self._words: list[str] = []
-        self._words_with_embeddings: list[tuple[str, list[float]]] = []
+        # Embeddings are held as one contiguous (N, D) matrix of unit-norm
+        # EMBEDDING_DTYPE rows with a parallel list of words (row i belongs
+        # to _embedding_words[i])
+        self._embedding_words: list[str] = []
+        self._embedding_matrix: Optional[np.ndarray] = None
         self._initialized = False
         self._last_refresh: Optional[datetime] = None
         self._pool_lock = Lock()
@@ -86,51 +108,75 @@ class VocabularyPool:
 
         try:
             # Fetch words in batches to avoid timeout
-            all_words = []
-            all_embeddings = []
             batch_size = 10_000
-            offset = 0
+            columns = "word, embedding" if load_embeddings else "word"
+
+            def fetch_page(offset: int):
+                """Fetch one page and parse it (runs in a worker thread)."""
+                # Pages are independent queries (some run concurrently);
+                # ordering by the unique word keeps their boundaries stable
+                result = supabase_client.table("vocabulary_embeddings") \
+                    .select(columns) \
+                    .order("word") \
+                    .range(offset, offset + batch_size - 1) \
+                    .execute()
+                return self._parse_page(result.data or [], load_embeddings)
+
+            # Row count up front lets every page be requested at once
+            count_result = await asyncio.to_thread(
+                supabase_client.table("vocabulary_embeddings")
+                .select("word", count="exact")
+                .range(0, 0)
+                .execute
+            )
+            total = count_result.count
+
+            if total:
+                semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PAGES)
+
+                async def fetch_page_bounded(offset: int):
+                    async with semaphore:
+                        return await asyncio.to_thread(fetch_page, offset)
+
+                pages = await asyncio.gather(
+                    *(fetch_page_bounded(offset) for offset in range(0, total, batch_size))
+                )
+            else:
+                # Count unavailable: page sequentially until a short page
+                pages = []
+                offset = 0
+                while True:
+                    page = await asyncio.to_thread(fetch_page, offset)
+                    if not page[0]:
+                        break
+                    pages.append(page)
+                    offset += batch_size
+                    if len(page[0]) < batch_size:
+                        break
+
+            # Pages come back in offset order
+            all_words = []
+            embedding_words = []
+            embedding_blocks = []
+            for page_words, page_embedding_words, page_block in pages:
+                all_words.extend(page_words)
+                embedding_words.extend(page_embedding_words)
+                if page_block is not None:
+                    embedding_blocks.append(page_block)
 
-            while True:
-                if load_embeddings:
-                    result = supabase_client.table("vocabulary_embeddings") \
-                        .select("word, embedding") \
-                        .range(offset, offset + batch_size - 1) \
-                        .execute()
-                else:
-                    result = supabase_client.table("vocabulary_embeddings") \
-                        .select("word") \
-                        .range(offset, offset + batch_size - 1) \
-                        .execute()
-
-                if not result.data:
-                    break
-
-                for row in result.data:
-                    all_words.append(row["word"])
-                    if load_embeddings and "embedding" in row:
-                        embedding = row["embedding"]
-                        # Parse embedding if it's a string (Supabase returns JSON strings)
-                        if isinstance(embedding, str):
-                            try:
-                                embedding = json.loads(embedding)
-                            except (json.JSONDecodeError, ValueError):
-                                continue  # Skip invalid embeddings
-                        if isinstance(embedding, list):
-                            all_embeddings.append((row["word"], embedding))
-
-                offset += batch_size
-
-                if len(result.data) < batch_size:
-                    break
+            embedding_matrix = np.vstack(embedding_blocks) if embedding_blocks else None
 
             with self._pool_lock:
                 self._words = all_words
                 if load_embeddings:
-                    self._words_with_embeddings = all_embeddings
+                    self._embedding_words = embedding_words
+                    self._embedding_matrix = embedding_matrix
                 self._initialized = True
                 self._last_refresh = datetime.now()
 
+            # Cached unions were ranked against the previous vocabulary
+            LexicalUnionCache.get_instance().clear()
+
             elapsed = (datetime.now() - start_time).total_seconds()
             print(f"VocabularyPool: Loaded {len(all_words)} words in {elapsed:.2f}s")
 
@@ -140,6 +186,49 @@ class VocabularyPool:
             self._initialized = True
             self._words = []
 
+    def _parse_page(
+        self,
+        rows: list[dict],
+        load_embeddings: bool
+    ) -> tuple[list[str], list[str], Optional[np.ndarray]]:
+        """
+        Parse one page of vocabulary rows.
+
+        Embeddings are converted to EMBEDDING_DTYPE and L2-normalized right
+        away so the boxed Python floats can be released before the other
+        pages are merged.
+
+        Returns:
+            (words, embedding_words, embedding_block) where embedding_block
+            is None if the page had no valid embeddings
+        """
+        words = []
+        embedding_words = []
+        embeddings = []
+        for row in rows:
+            words.append(row["word"])
+            if load_embeddings and "embedding" in row:
+                embedding = row["embedding"]
+                # Parse embedding if it's a string (Supabase returns JSON strings)
+                if isinstance(embedding, str):
+                    try:
+                        embedding = _json_loads(embedding)
+                    except ValueError:  # json/orjson JSONDecodeError
+                        continue  # Skip invalid embeddings
+                if isinstance(embedding, list):
+                    embedding_words.append(row["word"])
+                    embeddings.append(embedding)
+
+        if not embeddings:
+            return words, embedding_words, None
+
+        # Normalize rows once at ingest so consumers can treat cosine
+        # similarity as a plain dot product (zero rows stay zero)
+        block = np.asarray(embeddings, dtype=self.EMBEDDING_DTYPE)
+        norms = np.linalg.norm(block, axis=1, keepdims=True)
+        block /= np.where(norms == 0, 1, norms)
+        return words, embedding_words, block
+
     def needs_refresh(self) -> bool:
         """Check if the pool should be refreshed."""
         if not self._last_refresh:
@@ -183,7 +272,7 @@ class VocabularyPool:
     def get_random_with_embeddings(
         self,
         count: int
-    ) -> list[tuple[str, list[float]]]:
+    ) -> list[tuple[str, np.ndarray]]:
         """
         Get random words with their embeddings (for bootstrap sampling).
 
@@ -191,14 +280,32 @@ class VocabularyPool:
             count: Number of word-embedding pairs to return
 
         Returns:
-            List of (word, embedding) tuples
+            List of (word, embedding) tuples; embeddings are rows
+            of the shared vocabulary matrix
         """
         with self._pool_lock:
-            if not self._words_with_embeddings:
+            if self._embedding_matrix is None:
                 return []
 
-            sample_size = min(count, len(self._words_with_embeddings))
-            return random.sample(self._words_with_embeddings, sample_size)
+            sample_size = min(count, len(self._embedding_words))
+            indices = random.sample(range(len(self._embedding_words)), sample_size)
+            return [(self._embedding_words[i], self._embedding_matrix[i]) for i in indices]
+
+    def get_embedding_matrix(self) -> tuple[list[str], Optional[np.ndarray]]:
+        """
+        Get the full vocabulary as a contiguous (N, D) matrix of unit-norm
+        rows (EMBEDDING_DTYPE).
+
+        Built once at initialization, so callers can score the whole
+        vocabulary with a single matrix product instead of re-stacking
+        per-word lists.
+
+        Returns:
+            (words, matrix) where matrix[i] is the embedding of words[i],
+            or ([], None) if embeddings were not loaded
+        """
+        with self._pool_lock:
+            return self._embedding_words, self._embedding_matrix
 
     def contains(self, word: str) -> bool:
         """Check if a word is in the vocabulary."""
@@ -211,7 +318,7 @@ class VocabularyPool:
             return {
                 "initialized": self._initialized,
                 "word_count": len(self._words),
-                "embeddings_loaded": len(self._words_with_embeddings) > 0,
+                "embeddings_loaded": self._embedding_matrix is not None,
                 "last_refresh": self._last_refresh.isoformat() if self._last_refresh else None,
                 "needs_refresh": self.needs_refresh(),
             }
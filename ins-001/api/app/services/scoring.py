@@ -23,16 +23,25 @@ Literature basis:
 - Spread/Divergence: Divergent Association Task (Olson et al., 2021, PNAS)
 """
 
+import bisect
 import numpy as np
+from numpy.typing import ArrayLike
 from typing import Optional
 from scipy.optimize import linear_sum_assignment
 
+# Optional SIMD kernels (AVX2/AVX-512/NEON) for cosine similarity.
+# Falls back to NumPy when simsimd is not installed.
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
 
 # ============================================
 # CORE UTILITIES
 # ============================================
 
-def cosine_similarity(a: list[float], b: list[float]) -> float:
+def cosine_similarity(a: ArrayLike, b: ArrayLike) -> float:
     """
     Compute cosine similarity between two vectors.
 
@@ -42,18 +51,39 @@ def cosine_similarity(a: list[float], b: list[float]) -> float:
     - -1 = opposite direction
 
     For normalized embeddings (which OpenAI provides), this equals dot product.
+    Accepts lists or ndarrays. Uses the SimSIMD cosine kernel on float32 when
+    available.
     """
-    a = np.array(a)
-    b = np.array(b)
+    a = np.asarray(a, dtype=np.float32)
+    b = np.asarray(b, dtype=np.float32)
+
+    if simsimd is not None:
+        if not a.any() or not b.any():
+            return 0.0
+        return 1.0 - float(simsimd.cosine(a, b))
 
-    dot = np.dot(a, b)
-    norm_a = np.linalg.norm(a)
-    norm_b = np.linalg.norm(b)
+    # Squared norms via vdot skip np.linalg.norm's dispatch, and a single
+    # sqrt of the product replaces two
+    norm_sq_a = np.vdot(a, a)
+    norm_sq_b = np.vdot(b, b)
 
-    if norm_a == 0 or norm_b == 0:
+    if norm_sq_a == 0 or norm_sq_b == 0:
         return 0.0
 
-    return float(dot / (norm_a * norm_b))
+    return float(np.dot(a, b) / np.sqrt(norm_sq_a * norm_sq_b))
+
+
+def _mean_pairwise_distance(embeddings: list[list[float]]) -> float:
+    """
+    Mean cosine distance over all unordered pairs, scaled to 0-100.
+
+    Converts the embeddings once into a float32 (n, d) matrix and reads
+    the pairs off the upper triangle of its similarity matrix.
+    """
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    S = similarity_matrix(matrix, matrix)
+    i, j = np.triu_indices(len(matrix), k=1)
+    return float(np.mean(1 - S[i, j]) * 100)
 
 
 # ============================================
@@ -105,16 +135,7 @@ def calculate_divergence(
     if len(all_embeddings) < 2:
         return 0.0
 
-    distances = []
-    n = len(all_embeddings)
-
-    for i in range(n):
-        for j in range(i + 1, n):
-            sim = cosine_similarity(all_embeddings[i], all_embeddings[j])
-            distance = 1 - sim  # cosine distance
-            distances.append(distance)
-
-    return float(np.mean(distances) * 100)
+    return _mean_pairwise_distance(all_embeddings)
 
 
 # ============================================
@@ -145,16 +166,7 @@ def calculate_spread_clues_only(clue_embeddings: list[list[float]]) -> float:
         # Return 0 as a neutral score (will need calibration data to interpret)
         return 0.0
 
-    distances = []
-    n = len(clue_embeddings)
-
-    for i in range(n):
-        for j in range(i + 1, n):
-            sim = cosine_similarity(clue_embeddings[i], clue_embeddings[j])
-            distance = 1 - sim  # cosine distance
-            distances.append(distance)
-
-    return float(np.mean(distances) * 100)
+    return _mean_pairwise_distance(clue_embeddings)
 
 
 def score_radiation(
@@ -192,13 +204,13 @@ def score_radiation(
             "valid": False
         }
 
-    # Relevance: similarity to seed
-    relevance_scores = [
-        cosine_similarity(clue, seed_embedding)
-        for clue in clue_embeddings
-    ]
+    # Relevance: similarity to seed, all clues in one (N, 1) matrix
+    clue_matrix = np.asarray(clue_embeddings, dtype=np.float32)
+    seed_vec = np.asarray(seed_embedding, dtype=np.float32)[np.newaxis, :]
+    relevance = similarity_matrix(clue_matrix, seed_vec)[:, 0]
 
-    overall_relevance = float(np.mean(relevance_scores))
+    relevance_scores = relevance.tolist()
+    overall_relevance = float(relevance.mean())
 
     # Spread: clues-only (INS-001.1 primary metric)
     overall_spread = calculate_spread_clues_only(clue_embeddings)
@@ -291,14 +303,14 @@ def score_union(
         efficiency = 0.0
 
     # Relevance (legacy): min similarity to both endpoints
-    # Kept for backwards compatibility
-    relevance_scores = []
-    for clue in clue_embeddings:
-        sim_a = cosine_similarity(clue, anchor_embedding)
-        sim_t = cosine_similarity(clue, target_embedding)
-        relevance_scores.append(min(sim_a, sim_t))
+    # Kept for backwards compatibility. All clues are scored against
+    # [anchor, target] in one (N, 2) similarity matrix.
+    clue_matrix = np.asarray(clue_embeddings, dtype=np.float32)
+    endpoints = np.asarray([anchor_embedding, target_embedding], dtype=np.float32)
+    relevance = similarity_matrix(clue_matrix, endpoints).min(axis=1)
 
-    overall_relevance = float(np.mean(relevance_scores))
+    relevance_scores = relevance.tolist()
+    overall_relevance = float(relevance.mean())
 
     # Spread: clue-only pairwise distance (MTH-002.1 v2.0)
     # This isolates participant contribution from pair difficulty
@@ -348,20 +360,20 @@ def get_nearest_neighbors(
     Returns:
         List of n embedding vectors closest to target
     """
-    if not vocabulary_embeddings:
+    if len(vocabulary_embeddings) == 0 or n <= 0:
         return []
 
-    # Compute similarities to all vocabulary words
-    similarities = []
-    for i, emb in enumerate(vocabulary_embeddings):
-        sim = cosine_similarity(target_embedding, emb)
-        similarities.append((sim, i))
+    # Similarities to all vocabulary words in one batched call
+    target_vec = np.asarray(target_embedding, dtype=np.float32)[np.newaxis, :]
+    vocab_matrix = np.asarray(vocabulary_embeddings, dtype=np.float32)
+    similarities = similarity_matrix(target_vec, vocab_matrix)[0]
 
-    # Sort by similarity (descending) and take top n
-    similarities.sort(reverse=True, key=lambda x: x[0])
-    neighbors = [vocabulary_embeddings[idx] for _, idx in similarities[:n]]
+    # Partial selection of the top n, then order just those (descending)
+    n = min(n, len(similarities))
+    top = np.argpartition(-similarities, n - 1)[:n]
+    top = top[np.argsort(-similarities[top], kind="stable")]
 
-    return neighbors
+    return [vocabulary_embeddings[idx] for idx in top]
 
 
 def compute_fidelity(
@@ -425,50 +437,38 @@ def compute_fidelity(
             "fidelity_valid": False
         }
 
-    # For each clue, compute which foils it eliminates
-    anchor_eliminations = []
-    target_eliminations = []
-
-    for clue in clue_embeddings:
-        clue_to_anchor = cosine_similarity(clue, anchor_embedding)
-        clue_to_target = cosine_similarity(clue, target_embedding)
-
-        # A foil is "eliminated" if clue is closer to true anchor than to foil
-        a_elim = set()
-        for i, foil in enumerate(foil_anchors):
-            clue_to_foil = cosine_similarity(clue, foil)
-            if clue_to_anchor > clue_to_foil:
-                a_elim.add(i)
+    # For each clue, compute which foils it eliminates. All similarities come
+    # from three batched matrices instead of per-pair cosine calls.
+    clue_matrix = np.asarray(clue_embeddings, dtype=np.float32)
+    endpoints = np.asarray([anchor_embedding, target_embedding], dtype=np.float32)
+    clue_to_endpoints = similarity_matrix(clue_matrix, endpoints)  # (n_clues, 2)
+    clue_to_foil_anchors = similarity_matrix(clue_matrix, np.asarray(foil_anchors, dtype=np.float32))
+    clue_to_foil_targets = similarity_matrix(clue_matrix, np.asarray(foil_targets, dtype=np.float32))
 
-        # A foil is "eliminated" if clue is closer to true target than to foil
-        t_elim = set()
-        for i, foil in enumerate(foil_targets):
-            clue_to_foil = cosine_similarity(clue, foil)
-            if clue_to_target > clue_to_foil:
-                t_elim.add(i)
-
-        anchor_eliminations.append(a_elim)
-        target_eliminations.append(t_elim)
+    # A foil is "eliminated" if clue is closer to true anchor/target than to foil
+    # (boolean (n_clues, n_foils) masks)
+    anchor_eliminations = clue_to_endpoints[:, 0:1] > clue_to_foil_anchors
+    target_eliminations = clue_to_endpoints[:, 1:2] > clue_to_foil_targets
 
     # Measure coverage: what fraction of foils are eliminated by at least one clue?
-    anchor_union = set.union(*anchor_eliminations) if anchor_eliminations else set()
-    target_union = set.union(*target_eliminations) if target_eliminations else set()
+    anchor_union = int(anchor_eliminations.any(axis=0).sum())
+    target_union = int(target_eliminations.any(axis=0).sum())
 
-    anchor_coverage = len(anchor_union) / len(foil_anchors) if foil_anchors else 0.0
-    target_coverage = len(target_union) / len(foil_targets) if foil_targets else 0.0
+    anchor_coverage = anchor_union / len(foil_anchors)
+    target_coverage = target_union / len(foil_targets)
     coverage = (anchor_coverage + target_coverage) / 2
 
     # Measure efficiency: are clues non-redundant?
     # Redundancy = intersection / union (how much overlap)
     if anchor_union:
-        anchor_intersection = set.intersection(*anchor_eliminations)
-        anchor_redundancy = len(anchor_intersection) / len(anchor_union)
+        anchor_intersection = int(anchor_eliminations.all(axis=0).sum())
+        anchor_redundancy = anchor_intersection / anchor_union
     else:
         anchor_redundancy = 0.0
 
     if target_union:
-        target_intersection = set.intersection(*target_eliminations)
-        target_redundancy = len(target_intersection) / len(target_union)
+        target_intersection = int(target_eliminations.all(axis=0).sum())
+        target_redundancy = target_intersection / target_union
     else:
         target_redundancy = 0.0
 
@@ -487,6 +487,11 @@ def compute_fidelity(
     }
 
 
+# Interpretation bands: label i applies while score < threshold i
+_FIDELITY_THRESHOLDS = (0.50, 0.65, 0.75, 0.85)
+_FIDELITY_LABELS = ("Poor", "Below Average", "Average", "Above Average", "Excellent")
+
+
 def get_fidelity_interpretation(score: float) -> str:
     """
     Get human-readable interpretation of fidelity score.
@@ -504,16 +509,7 @@ def get_fidelity_interpretation(score: float) -> str:
     Returns:
         Interpretation label
     """
-    if score < 0.50:
-        return "Poor"
-    elif score < 0.65:
-        return "Below Average"
-    elif score < 0.75:
-        return "Average"
-    elif score < 0.85:
-        return "Above Average"
-    else:
-        return "Excellent"
+    return _FIDELITY_LABELS[bisect.bisect_right(_FIDELITY_THRESHOLDS, score)]
 
 
 # ============================================
@@ -570,13 +566,13 @@ def bootstrap_null_distribution(
     relevance_samples = []
     divergence_samples = []
 
-    vocab_array = np.array(vocabulary_embeddings)
+    vocab_array = np.asarray(vocabulary_embeddings, dtype=np.float32)
     n_vocab = len(vocab_array)
 
     for _ in range(n_samples):
-        # Sample n random words (without replacement)
+        # Sample n random words (without replacement); rows stay ndarrays
         indices = rng.choice(n_vocab, size=min(n_clues, n_vocab), replace=False)
-        sample_embeddings = [vocab_array[i].tolist() for i in indices]
+        sample_embeddings = list(vocab_array[indices])
 
         # Score this random set
         if instrument == "radiation":
@@ -722,6 +718,10 @@ def compare_submissions(
 # INTERPRETATION HELPERS
 # ============================================
 
+_RELEVANCE_THRESHOLDS = (0.15, 0.30, 0.45)
+_RELEVANCE_LABELS = ("Noise", "Weak", "Moderate", "Strong")
+
+
 def get_relevance_interpretation(score: float) -> str:
     """
     Get human-readable interpretation of relevance score.
@@ -732,14 +732,11 @@ def get_relevance_interpretation(score: float) -> str:
     Returns:
         Interpretation label
     """
-    if score < 0.15:
-        return "Noise"
-    elif score < 0.30:
-        return "Weak"
-    elif score < 0.45:
-        return "Moderate"
-    else:
-        return "Strong"
+    return _RELEVANCE_LABELS[bisect.bisect_right(_RELEVANCE_THRESHOLDS, score)]
+
+
+_DIVERGENCE_THRESHOLDS = (50, 75, 85, 95)
+_DIVERGENCE_LABELS = ("Low", "Below Average", "Average", "Above Average", "High")
 
 
 def get_divergence_interpretation(score: float) -> str:
@@ -759,16 +756,11 @@ def get_divergence_interpretation(score: float) -> str:
     Returns:
         Interpretation label
     """
-    if score < 50:
-        return "Low"
-    elif score < 75:
-        return "Below Average"
-    elif score < 85:
-        return "Average"
-    elif score < 95:
-        return "Above Average"
-    else:
-        return "High"
+    return _DIVERGENCE_LABELS[bisect.bisect_right(_DIVERGENCE_THRESHOLDS, score)]
+
+
+_SPREAD_INS001_1_THRESHOLDS = (33, 66)
+_SPREAD_INS001_1_LABELS = ("Low", "Medium", "High")
 
 
 def get_spread_interpretation_ins001_1(score: float) -> str:
@@ -802,12 +794,7 @@ def get_spread_interpretation_ins001_1(score: float) -> str:
     normalized = max(0, min(100, ((score - 20) / 60) * 100))
 
     # Bands: Low (0-33%), Medium (33-66%), High (66-100%)
-    if normalized < 33:
-        return "Low"
-    elif normalized < 66:
-        return "Medium"
-    else:
-        return "High"
+    return _SPREAD_INS001_1_LABELS[bisect.bisect_right(_SPREAD_INS001_1_THRESHOLDS, normalized)]
 
 
 # ============================================
@@ -821,6 +808,23 @@ import warnings
 # Old threshold constant (kept for compatibility)
 FUZZY_EXACT_MATCH_THRESHOLD = 0.99
 
+# Deprecated functions that have already warned in this process
+_deprecation_warned: set[str] = set()
+
+
+def _warn_deprecated(name: str, message: str) -> None:
+    """
+    Emit a DeprecationWarning the first time a deprecated function is called.
+
+    warnings.warn walks the stack and consults the filter list on every
+    call, which adds up when legacy scoring runs in loops. Also used by the
+    deprecated functions in scoring_bridging.py.
+    """
+    if name in _deprecation_warned:
+        return
+    _deprecation_warned.add(name)
+    warnings.warn(message, DeprecationWarning, stacklevel=3)
+
 
 def compute_divergence(
     clue_embeddings: list[list[float]],
@@ -831,10 +835,9 @@ def compute_divergence(
 
     Old divergence algorithm based on noise floor centroid.
     """
-    warnings.warn(
-        "compute_divergence is deprecated. Use calculate_divergence with DAT-style scoring.",
-        DeprecationWarning,
-        stacklevel=2
+    _warn_deprecated(
+        "compute_divergence",
+        "compute_divergence is deprecated. Use calculate_divergence with DAT-style scoring."
     )
 
     if not clue_embeddings or not floor_embeddings:
@@ -845,7 +848,7 @@ def compute_divergence(
 
     similarities = []
     for clue_emb in clue_embeddings:
-        sim = cosine_similarity(clue_emb, floor_centroid.tolist())
+        sim = cosine_similarity(clue_emb, floor_centroid)
         similarities.append(sim)
 
     mean_similarity = np.mean(similarities)
@@ -865,10 +868,9 @@ def compute_convergence(
 
     Old convergence algorithm for single-word reconstruction.
     """
-    warnings.warn(
-        "compute_convergence is deprecated and not used in INS-001 scoring.",
-        DeprecationWarning,
-        stacklevel=2
+    _warn_deprecated(
+        "compute_convergence",
+        "compute_convergence is deprecated and not used in INS-001 scoring."
     )
 
     seed_lower = seed_word.lower().strip()
@@ -903,10 +905,9 @@ def compute_semantic_portability(
     """
     DEPRECATED: Derived metric requiring network/stranger convergence.
     """
-    warnings.warn(
-        "compute_semantic_portability is deprecated.",
-        DeprecationWarning,
-        stacklevel=2
+    _warn_deprecated(
+        "compute_semantic_portability",
+        "compute_semantic_portability is deprecated."
     )
 
     if network_convergence is None or stranger_convergence is None:
@@ -924,10 +925,9 @@ def compute_consistency(
     """
     DEPRECATED: Cross-game aggregate; compute from raw divergence if needed.
     """
-    warnings.warn(
-        "compute_consistency is deprecated.",
-        DeprecationWarning,
-        stacklevel=2
+    _warn_deprecated(
+        "compute_consistency",
+        "compute_consistency is deprecated."
     )
 
     if divergence_mean is None or divergence_std is None:
@@ -946,10 +946,9 @@ def compute_llm_alignment(
     """
     DEPRECATED: Use compare_submissions() instead.
     """
-    warnings.warn(
-        "compute_llm_alignment is deprecated. Use compare_submissions instead.",
-        DeprecationWarning,
-        stacklevel=2
+    _warn_deprecated(
+        "compute_llm_alignment",
+        "compute_llm_alignment is deprecated. Use compare_submissions instead."
     )
 
     if llm_convergence is None or stranger_convergence is None:
@@ -969,10 +968,9 @@ def classify_archetype(
     """
     DEPRECATED: Dependent on deprecated convergence metrics.
     """
-    warnings.warn(
-        "classify_archetype is deprecated.",
-        DeprecationWarning,
-        stacklevel=2
+    _warn_deprecated(
+        "classify_archetype",
+        "classify_archetype is deprecated."
     )
 
     high_div = divergence > 0.5
@@ -1367,7 +1365,7 @@ def compute_bridge_similarity(
     centroid2 = np.mean(np.array(bridge2_embeddings), axis=0)
 
     # Return similarity (convert from [-1, 1] to [0, 1] range)
-    sim = cosine_similarity(centroid1.tolist(), centroid2.tolist())
+    sim = cosine_similarity(centroid1, centroid2)
     return float((sim + 1) / 2)  # Map [-1, 1] to [0, 1]
 
 
@@ -1408,7 +1406,7 @@ def test_interpretation_helpers():
 # "Measuring Constructive Creativity in AI-Augmented Work" (Patel, 2026)
 # ============================================
 
-def _similarity_matrix(targets: np.ndarray, associations: np.ndarray) -> np.ndarray:
+def similarity_matrix(targets: np.ndarray, associations: np.ndarray) -> np.ndarray:
     """
     Build m×n cosine similarity matrix.
 
@@ -1419,6 +1417,15 @@ def _similarity_matrix(targets: np.ndarray, associations: np.ndarray) -> np.ndar
     Returns:
         (m, n) similarity matrix where S[i,j] = sim(t_i, a_j)
     """
+    if simsimd is not None:
+        t32 = np.ascontiguousarray(targets, dtype=np.float32)
+        a32 = np.ascontiguousarray(associations, dtype=np.float32)
+        S = 1.0 - np.asarray(simsimd.cdist(t32, a32, metric="cosine"))
+        # Zero vectors have no direction: similarity 0 (matches NumPy path)
+        S[~t32.any(axis=1), :] = 0.0
+        S[:, ~a32.any(axis=1)] = 0.0
+        return S
+
     t_norms = np.linalg.norm(targets, axis=1, keepdims=True)
     a_norms = np.linalg.norm(associations, axis=1, keepdims=True)
     t_norms = np.where(t_norms == 0, 1, t_norms)
@@ -1428,6 +1435,10 @@ def _similarity_matrix(targets: np.ndarray, associations: np.ndarray) -> np.ndar
     return t_norm @ a_norm.T
 
 
+# Backwards-compatible private alias
+_similarity_matrix = similarity_matrix
+
+
 def bipartite_fit(targets: np.ndarray, associations: np.ndarray) -> float:
     """
     Optimal one-to-one matching via Hungarian algorithm.
@@ -1441,7 +1452,7 @@ def bipartite_fit(targets: np.ndarray, associations: np.ndarray) -> float:
     Returns:
         Mean similarity of optimal matching.
     """
-    S = _similarity_matrix(targets, associations)
+    S = similarity_matrix(targets, associations)
     row_ind, col_ind = linear_sum_assignment(-S)
     matched_sims = S[row_ind, col_ind]
     return float(np.mean(matched_sims))
@@ -1551,7 +1562,7 @@ def _max_sim_fit(associations: np.ndarray, targets: np.ndarray) -> float:
 
     For each target, find the best-matching association.
     """
-    S = _similarity_matrix(targets, associations)  # (m, n)
+    S = similarity_matrix(targets, associations)  # (m, n)
     return float(np.mean(np.max(S, axis=1)))
 
 
@@ -1597,6 +1608,7 @@ def compute_recovery_mrr(
     targets: np.ndarray,
     associations: np.ndarray,
     vocab_embeddings: np.ndarray,
+    vocab_normalized: bool = False,
 ) -> float:
     """
     Mean Reciprocal Rank of true targets when vocabulary is ranked
@@ -1608,15 +1620,21 @@ def compute_recovery_mrr(
         targets: (m, d) array of target embeddings
         associations: (n, d) array of association embeddings
         vocab_embeddings: (V, d) array — full vocabulary
+        vocab_normalized: True if vocab rows are already unit-norm (e.g. the
+            VocabularyPool matrix), which skips renormalizing V x d values
+            on every call
 
     Returns:
         Recovery MRR score. Higher = associations make targets more identifiable.
     """
-    v_norms = np.linalg.norm(vocab_embeddings, axis=1, keepdims=True)
+    if vocab_normalized:
+        v_norm = vocab_embeddings
+    else:
+        v_norms = np.linalg.norm(vocab_embeddings, axis=1, keepdims=True)
+        v_norms = np.where(v_norms == 0, 1, v_norms)
+        v_norm = vocab_embeddings / v_norms
     a_norms = np.linalg.norm(associations, axis=1, keepdims=True)
-    v_norms = np.where(v_norms == 0, 1, v_norms)
     a_norms = np.where(a_norms == 0, 1, a_norms)
-    v_norm = vocab_embeddings / v_norms
     a_norm = associations / a_norms
 
     # (V, n) similarity matrix → max per vocab word
@@ -1644,9 +1662,8 @@ def score_study_dat(association_embeddings: np.ndarray) -> dict:
     Score a DAT submission for a study (free association, no targets).
     Uses existing calculate_spread_clues_only for 0-100 scale divergence.
     """
-    emb_list = [e.tolist() if isinstance(e, np.ndarray) else e for e in association_embeddings]
     return {
-        "divergence": calculate_spread_clues_only(emb_list),
+        "divergence": calculate_spread_clues_only(association_embeddings),
     }
 
 
@@ -1686,6 +1703,7 @@ def score_study_bridge(
     association_embeddings: np.ndarray,
     foil_sets: list[np.ndarray],
     vocab_embeddings: Optional[np.ndarray] = None,
+    vocab_normalized: bool = False,
 ) -> dict:
     """
     Score a Bridge submission for a study using paper formulations.
@@ -1695,14 +1713,14 @@ def score_study_bridge(
         association_embeddings: (n, d) array
         foil_sets: Precomputed foil sets for alignment
         vocab_embeddings: Optional (V, d) array for recovery computation
+        vocab_normalized: True if vocab_embeddings rows are unit-norm
 
     Returns:
         Dict with divergence, alignment, parsimony, and optionally recovery_mrr.
     """
-    emb_list = [e.tolist() if isinstance(e, np.ndarray) else e for e in association_embeddings]
     alignment = compute_alignment(target_embeddings, association_embeddings, foil_sets)
     result = {
-        "divergence": calculate_spread_clues_only(emb_list),
+        "divergence": calculate_spread_clues_only(association_embeddings),
         "alignment": alignment["a_scaled"],
         "alignment_z": alignment["a_z"],
         "alignment_display": alignment["a_display"],
@@ -1710,7 +1728,8 @@ def score_study_bridge(
     }
     if vocab_embeddings is not None:
         result["recovery_mrr"] = compute_recovery_mrr(
-            target_embeddings, association_embeddings, vocab_embeddings
+            target_embeddings, association_embeddings, vocab_embeddings,
+            vocab_normalized=vocab_normalized
         )
     return result
 
@@ -15,8 +15,12 @@ For the unified scoring framework, see scoring.py which contains:
 - compare_submissions(): Compare participant vs baseline
 """
 
-import warnings
+import asyncio
+import bisect
+import re
 import numpy as np
+from numpy.typing import ArrayLike
+from functools import lru_cache
 from typing import Optional
 
 # Re-export unified scoring functions from scoring.py
@@ -30,13 +34,43 @@ from .scoring import (
     get_relevance_interpretation,
     get_divergence_interpretation,
     RELEVANCE_THRESHOLD,
+    similarity_matrix,
+    _warn_deprecated,
 )
+from .cache import EmbeddingCache, LexicalUnionCache
 
 
 # ============================================
 # UTILITY FUNCTIONS (Morphological Filtering)
 # ============================================
 
+# Common suffixes to strip (order matters - check longer ones first)
+_STEM_SUFFIXES = (
+    # Long compound suffixes (check first)
+    'isation', 'ization', 'istically', 'ologically', 'fulness',
+    'ically', 'iously', 'ously', 'atively', 'ively', 'ately',
+    # Medium suffixes
+    'ation', 'ition', 'ution', 'ture', 'ness', 'ment', 'able', 'ible',
+    'tion', 'sion', 'ally', 'ical', 'ious', 'eous', 'ance', 'ence',
+    'ful', 'less', 'ing', 'ity', 'ous', 'ive', 'ant', 'ent',
+    # Short suffixes (check last to avoid over-stripping)
+    'est', 'ier', 'ies', 'ied', 'ure', 'ate', 'ism', 'ist',
+    'al', 'ar', 'ic', 'ly', 'ed', 'er', 'en', 'es', 'um', 'us', 's'
+)
+
+# Single compiled alternation over the suffix table. The lazy stem group
+# (at least 3 chars, i.e. len(word) > len(suffix) + 2) makes the engine
+# try the longest suffix first. No suffix in the table is preceded by a
+# shorter suffix of itself, so this picks the same suffix as scanning
+# the table in order.
+_STEM_SUFFIX_RE = re.compile(
+    r"^(.{3,}?)(?:" + "|".join(map(re.escape, _STEM_SUFFIXES)) + r")\Z",
+    re.DOTALL
+)
+
+
+# Sized to hold the whole vocabulary (~30K words) plus intermediate stems
+@lru_cache(maxsize=100_000)
 def _get_word_stem(word: str) -> str:
     """
     Get a simple stem for morphological variant detection.
@@ -51,27 +85,14 @@ def _get_word_stem(word: str) -> str:
     """
     word = word.lower()
 
-    # Common suffixes to strip (order matters - check longer ones first)
-    suffixes = [
-        # Long compound suffixes (check first)
-        'isation', 'ization', 'istically', 'ologically', 'fulness',
-        'ically', 'iously', 'ously', 'atively', 'ively', 'ately',
-        # Medium suffixes
-        'ation', 'ition', 'ution', 'ture', 'ness', 'ment', 'able', 'ible',
-        'tion', 'sion', 'ally', 'ical', 'ious', 'eous', 'ance', 'ence',
-        'ful', 'less', 'ing', 'ity', 'ous', 'ive', 'ant', 'ent',
-        # Short suffixes (check last to avoid over-stripping)
-        'est', 'ier', 'ies', 'ied', 'ure', 'ate', 'ism', 'ist',
-        'al', 'ar', 'ic', 'ly', 'ed', 'er', 'en', 'es', 'um', 'us', 's'
-    ]
-
-    for suffix in suffixes:
-        if word.endswith(suffix) and len(word) > len(suffix) + 2:
-            return word[:-len(suffix)]
+    match = _STEM_SUFFIX_RE.match(word)
+    if match:
+        return match.group(1)
 
     return word
 
 
+@lru_cache(maxsize=100_000)
 def _normalize_stem(word: str) -> str:
     """
     Normalize a word stem for comparison, handling Y→I transformations
@@ -116,6 +137,22 @@ def _normalize_stem(word: str) -> str:
     return stem
 
 
+# Common prefixes (order by length, longest first)
+_STRIP_PREFIXES = (
+    'counter', 'under', 'over', 'anti', 'dis', 'mis', 'non',
+    'pre', 'un', 'in', 'im', 're'
+)
+
+# Alternatives are tried in table order and the lookahead (at least 4 chars
+# left, i.e. len(word) > len(prefix) + 3) backtracks to the next prefix on
+# failure, so this matches exactly what scanning the table would.
+_STRIP_PREFIX_RE = re.compile(
+    r"(?:" + "|".join(map(re.escape, _STRIP_PREFIXES)) + r")(?=.{4,}\Z)",
+    re.DOTALL
+)
+
+
+@lru_cache(maxsize=100_000)
 def _strip_common_prefixes(word: str) -> str:
     """
     Strip common morphological prefixes from a word.
@@ -124,15 +161,9 @@ def _strip_common_prefixes(word: str) -> str:
     """
     word = word.lower()
 
-    # Common prefixes (order by length, longest first)
-    prefixes = [
-        'counter', 'under', 'over', 'anti', 'dis', 'mis', 'non',
-        'pre', 'un', 'in', 'im', 're'
-    ]
-
-    for prefix in prefixes:
-        if word.startswith(prefix) and len(word) > len(prefix) + 3:
-            return word[len(prefix):]
+    match = _STRIP_PREFIX_RE.match(word)
+    if match:
+        return word[match.end():]
 
     return word
 
@@ -178,11 +209,11 @@ def _is_morphological_variant(word1: str, word2: str, min_common_prefix: int = 5
     if w1 == w2:
         return True
 
-    # One is substring of the other (catches most plurals/verb forms)
-    if w1.startswith(w2) or w2.startswith(w1):
-        # But not if they're very different lengths (e.g., "cat" vs "catalyst")
-        if abs(len(w1) - len(w2)) <= 4:
-            return True
+    # One is substring of the other (catches most plurals/verb forms),
+    # but not if they're very different lengths (e.g., "cat" vs "catalyst").
+    # The length test is cheaper, so it runs first.
+    if abs(len(w1) - len(w2)) <= 4 and (w1.startswith(w2) or w2.startswith(w1)):
+        return True
 
     # Get prefix-stripped versions
     w1_stripped = _strip_common_prefixes(w1)
@@ -216,9 +247,10 @@ def _is_morphological_variant(word1: str, word2: str, min_common_prefix: int = 5
         return True
 
     # Check if one stripped version is substring of the other (within length limit)
-    if w1_stripped.startswith(w2_stripped) or w2_stripped.startswith(w1_stripped):
-        if abs(len(w1_stripped) - len(w2_stripped)) <= 4:
-            return True
+    if abs(len(w1_stripped) - len(w2_stripped)) <= 4 and (
+        w1_stripped.startswith(w2_stripped) or w2_stripped.startswith(w1_stripped)
+    ):
+        return True
 
     # NEW: Check if stems share a common prefix of sufficient length
     # This handles Latin root variants like:
@@ -241,10 +273,70 @@ def _is_morphological_variant(word1: str, word2: str, min_common_prefix: int = 5
     return False
 
 
+def _filter_union_candidates(
+    candidates,
+    anchor: str,
+    target: str,
+    num_concepts: int
+) -> tuple[list[str], int]:
+    """
+    Greedily select union words from ranked candidates, skipping
+    morphological variants of anchor, target, and words already selected.
+
+    Each candidate's normalized stem is computed once and checked against
+    a set of selected stems first. A stem hit is always a variant (same
+    rule as in _is_morphological_variant), so most variants are rejected
+    by a hash lookup; the rest fall through to the full pairwise check.
+
+    Args:
+        candidates: Candidate words, best first
+        anchor: The anchor concept
+        target: The target concept
+        num_concepts: Number of union words to select
+
+    Returns:
+        (union_words, filtered_count)
+    """
+    used_words = [anchor.lower(), target.lower()]
+    used_stems = {_normalize_stem(w) for w in used_words}
+    union_words = []
+    filtered_count = 0
+
+    for word in candidates:
+        word_lower = word.lower()
+        stem = _normalize_stem(word_lower)
+
+        if stem in used_stems or any(
+            _is_morphological_variant(word_lower, used) for used in used_words
+        ):
+            filtered_count += 1
+            continue
+
+        union_words.append(word)
+        used_words.append(word_lower)
+        used_stems.add(stem)
+
+        if len(union_words) >= num_concepts:
+            break
+
+    return union_words, filtered_count
+
+
 # ============================================
 # STATISTICAL UNION FINDER (Database Function)
 # ============================================
 
+def _vector_literal(embedding: ArrayLike) -> str:
+    """
+    Format an embedding as a compact pgvector text literal ("[x,y,...]").
+
+    pgvector stores float4, so each component is written with the shortest
+    repr that round-trips at float32 precision. The payload is roughly half
+    the size of json.dumps on the float64 list, with nothing lost.
+    """
+    return "[" + ",".join(map(str, np.asarray(embedding, dtype=np.float32))) + "]"
+
+
 async def find_lexical_union(
     anchor: str,
     target: str,
@@ -271,11 +363,15 @@ async def find_lexical_union(
     Returns:
         List of union words (unordered set, but returned as list)
     """
-    import json
-    from .embeddings import get_embeddings_batch
-
-    # Get anchor and target embeddings
-    embeddings = await get_embeddings_batch([anchor, target])
+    # The union depends only on the pair and the vocabulary snapshot, so
+    # repeated puzzles are served from cache
+    union_cache = LexicalUnionCache.get_instance()
+    cached_union = union_cache.get(anchor, target, num_concepts)
+    if cached_union is not None:
+        return cached_union
+
+    # Get anchor and target embeddings (shared LRU cache; puzzle words recur)
+    embeddings = await EmbeddingCache.get_instance().get_embeddings_batch([anchor, target])
     anchor_emb = embeddings[0]
     target_emb = embeddings[1]
 
@@ -284,15 +380,18 @@ async def find_lexical_union(
     k = num_concepts * 3 + 10
 
     try:
-        # Use database function for fast server-side scoring
-        result = supabase.rpc(
-            "get_statistical_union",
-            {
-                "anchor_embedding": json.dumps(anchor_emb),
-                "target_embedding": json.dumps(target_emb),
-                "k": k
-            }
-        ).execute()
+        # Use database function for fast server-side scoring. The Supabase
+        # client is synchronous, so run the round-trip off the event loop.
+        result = await asyncio.to_thread(
+            supabase.rpc(
+                "get_statistical_union",
+                {
+                    "anchor_embedding": _vector_literal(anchor_emb),
+                    "target_embedding": _vector_literal(target_emb),
+                    "k": k
+                }
+            ).execute
+        )
 
         if not result.data:
             print(f"[find_lexical_union] No data returned from get_statistical_union for {anchor}/{target}")
@@ -300,47 +399,48 @@ async def find_lexical_union(
 
         print(f"[find_lexical_union] Got {len(result.data)} candidates for {anchor}/{target}")
 
-        # Filter results for morphological variants
-        used_words = [anchor.lower(), target.lower()]
-        union_words = []
-        filtered_count = 0
-
-        for row in result.data:
-            word = row["word"]
-
-            # Skip anchor/target
-            if word.lower() == anchor.lower() or word.lower() == target.lower():
-                filtered_count += 1
-                continue
-
-            # Skip morphological variants of anchor/target
-            if _is_morphological_variant(word, anchor) or _is_morphological_variant(word, target):
-                filtered_count += 1
-                continue
-
-            # Skip morphological variants of already selected words
-            is_variant = any(_is_morphological_variant(word, used) for used in used_words)
-            if is_variant:
-                filtered_count += 1
-                continue
-
-            union_words.append(word)
-            used_words.append(word.lower())
-
-            if len(union_words) >= num_concepts:
-                break
+        # Filter results for morphological variants (of anchor/target and
+        # of already selected words)
+        union_words, filtered_count = _filter_union_candidates(
+            (row["word"] for row in result.data), anchor, target, num_concepts
+        )
 
         print(f"[find_lexical_union] Returning {len(union_words)} words after filtering {filtered_count} variants")
+        if union_words:
+            union_cache.put(anchor, target, num_concepts, union_words)
         return union_words
 
     except Exception as e:
         print(f"[find_lexical_union] get_statistical_union failed: {e}, falling back to neighbor sampling")
         import traceback
         traceback.print_exc()
-        # Fallback to neighbor-based sampling if database function doesn't exist
+        # Fallback to neighbor-based sampling if database function doesn't exist.
+        # Not cached: the RPC result should be used once it recovers.
         return await _find_lexical_union_fallback(anchor, target, num_concepts, supabase, anchor_emb, target_emb)
 
 
+async def _fetch_noise_floor(
+    supabase,
+    function_name: str,
+    seed_embedding: list[float],
+    seed_word: str,
+    k: int = 200
+) -> list[dict]:
+    """Run a noise-floor RPC off the event loop and return its rows."""
+    # Note: RPC expects TEXT (vector literal) after migration 110
+    result = await asyncio.to_thread(
+        supabase.rpc(
+            function_name,
+            {
+                "seed_embedding": _vector_literal(seed_embedding),
+                "seed_word": seed_word,
+                "k": k
+            }
+        ).execute
+    )
+    return result.data or []
+
+
 async def _find_lexical_union_fallback(
     anchor: str,
     target: str,
@@ -353,79 +453,75 @@ async def _find_lexical_union_fallback(
     Fallback: Sample neighbors of anchor and target, score by sum of similarities.
     Less accurate than full scan but works without database function.
     """
-    import json
-
-    anchor_vec = np.array(anchor_emb)
-    target_vec = np.array(target_emb)
-
-    # Get candidates near both anchor and target regions
-    # Note: RPC expects TEXT (JSON array) after migration 110
-    anchor_result = supabase.rpc(
-        "get_noise_floor_by_embedding",
-        {
-            "seed_embedding": json.dumps(anchor_vec.tolist()),
-            "seed_word": anchor,
-            "k": 200
-        }
-    ).execute()
-
-    target_result = supabase.rpc(
-        "get_noise_floor_by_embedding",
-        {
-            "seed_embedding": json.dumps(target_vec.tolist()),
-            "seed_word": target,
-            "k": 200
-        }
-    ).execute()
+    anchor_vec = np.asarray(anchor_emb, dtype=np.float32)
+    target_vec = np.asarray(target_emb, dtype=np.float32)
+
+    # Get candidates near both anchor and target regions. Migration 122's
+    # RPC returns each neighbour's vector too, which saves re-embedding
+    # the candidates; older databases only have the words-only RPC.
+    # The anchor and target searches are independent, so both round-trips
+    # run concurrently.
+    try:
+        anchor_rows, target_rows = await asyncio.gather(
+            _fetch_noise_floor(supabase, "get_noise_floor_by_embedding_with_vec", anchor_emb, anchor),
+            _fetch_noise_floor(supabase, "get_noise_floor_by_embedding_with_vec", target_emb, target),
+        )
+        with_vectors = True
+    except Exception as e:
+        print(f"[find_lexical_union] get_noise_floor_by_embedding_with_vec failed: {e}, fetching embeddings separately")
+        anchor_rows, target_rows = await asyncio.gather(
+            _fetch_noise_floor(supabase, "get_noise_floor_by_embedding", anchor_emb, anchor),
+            _fetch_noise_floor(supabase, "get_noise_floor_by_embedding", target_emb, target),
+        )
+        with_vectors = False
 
-    if not anchor_result.data and not target_result.data:
+    if not anchor_rows and not target_rows:
         return []
 
-    # Combine and deduplicate candidates
-    candidate_words_set = set()
-    candidate_words = []
-    for r in (anchor_result.data or []) + (target_result.data or []):
-        word = r["word"]
-        if word not in candidate_words_set:
-            candidate_words_set.add(word)
-            candidate_words.append(word)
+    # Combine and deduplicate candidates (first occurrence wins; dicts keep
+    # insertion order), dropping morphological variants of anchor/target
+    # up front so they are never embedded or scored
+    unique_rows = {}
+    for r in anchor_rows + target_rows:
+        unique_rows.setdefault(r["word"], r)
+
+    candidate_words = [
+        word for word in unique_rows
+        if not (_is_morphological_variant(word, anchor) or _is_morphological_variant(word, target))
+    ]
+    candidate_rows = [unique_rows[word] for word in candidate_words]
 
     if not candidate_words:
         return []
 
-    # Get embeddings for all candidates
-    from .embeddings import get_embeddings_batch
-    candidate_embeddings = await get_embeddings_batch(candidate_words)
-
-    # Score by sum of similarities
-    scored_candidates = []
-    for word, emb in zip(candidate_words, candidate_embeddings):
-        if _is_morphological_variant(word, anchor) or _is_morphological_variant(word, target):
-            continue
+    if with_vectors:
+        # Vectors came back with the neighbours: one (N, D) matrix, no refetch
+        candidate_matrix = np.asarray(
+            [r["embedding"] for r in candidate_rows], dtype=np.float32
+        )
+    else:
+        # Get embeddings for all candidates. Neighbours of the same endpoints
+        # recur across games, so go through the shared LRU embedding cache and
+        # only fetch misses from OpenAI.
+        candidate_embeddings = await EmbeddingCache.get_instance().get_embeddings_batch(candidate_words)
 
-        word_vec = np.array(emb)
-        sim_anchor = cosine_similarity(word_vec.tolist(), anchor_vec.tolist())
-        sim_target = cosine_similarity(word_vec.tolist(), target_vec.tolist())
-        score = sim_anchor + sim_target
+        # Convert candidate embeddings once into an (N, D) matrix
+        candidate_matrix = np.asarray(candidate_embeddings, dtype=np.float32)
 
-        scored_candidates.append((word, score))
+    # Similarity of every candidate to anchor and target in one batched
+    # kernel call: (N, 2) matrix, columns = [sim_anchor, sim_target]
+    endpoint_sims = similarity_matrix(candidate_matrix, np.stack([anchor_vec, target_vec]))
+    scores = endpoint_sims.sum(axis=1)
 
-    scored_candidates.sort(key=lambda x: x[1], reverse=True)
+    # Rank by sum of similarities (descending). The greedy variant filter
+    # below can reject an unknown number of candidates, so the full order
+    # is needed; a stable argsort keeps ties in candidate order.
+    ranked = np.argsort(-scores, kind="stable")
 
     # Select top N, filtering morphological variants
-    used_words = [anchor.lower(), target.lower()]
-    union_words = []
-
-    for word, score in scored_candidates:
-        is_variant = any(_is_morphological_variant(word, used) for used in used_words)
-        if is_variant:
-            continue
-
-        union_words.append(word)
-        used_words.append(word.lower())
-
-        if len(union_words) >= num_concepts:
-            break
+    union_words, _ = _filter_union_candidates(
+        (candidate_words[idx] for idx in ranked), anchor, target, num_concepts
+    )
 
     return union_words
 
@@ -455,11 +551,10 @@ async def find_lexical_bridge(
 CALIBRATION_MAX = 0.8
 JOINT_DISTANCE_MAX_DIFF = 1.5
 
-
 def calculate_binding_strength(
-    anchor_embedding: list[float],
-    target_embedding: list[float],
-    clue_embeddings: list[list[float]]
+    anchor_embedding: ArrayLike,
+    target_embedding: ArrayLike,
+    clue_embeddings: ArrayLike
 ) -> float:
     """
     DEPRECATED: Use score_union() from scoring.py instead.
@@ -467,32 +562,30 @@ def calculate_binding_strength(
     Calculate binding strength using the old min-based approach.
     This is superseded by relevance (mean-based approach).
     """
-    warnings.warn(
-        "calculate_binding_strength is deprecated. Use score_union from scoring.py instead.",
-        DeprecationWarning,
-        stacklevel=2
+    _warn_deprecated(
+        "calculate_binding_strength",
+        "calculate_binding_strength is deprecated. Use score_union from scoring.py instead."
     )
 
-    if not clue_embeddings:
+    if len(clue_embeddings) == 0:
         return 0.0
 
-    joint_scores = []
-    for clue_emb in clue_embeddings:
-        sim_anchor = cosine_similarity(clue_emb, anchor_embedding)
-        sim_target = cosine_similarity(clue_emb, target_embedding)
-        joint = min(sim_anchor, sim_target)
-        joint_scores.append(joint)
+    # Stack clues once and score against [anchor, target] in one (N, 2)
+    # similarity matrix; joint score is the weaker of the two links
+    clue_matrix = np.asarray(clue_embeddings, dtype=np.float32)
+    endpoints = np.asarray([anchor_embedding, target_embedding], dtype=np.float32)
+    joint_scores = similarity_matrix(clue_matrix, endpoints).min(axis=1)
 
-    mean_joint = np.mean(joint_scores)
+    mean_joint = joint_scores.mean()
     normalized_score = min(100.0, (mean_joint / 0.6) * 100)
     return float(max(0.0, normalized_score))
 
 
 def calculate_reconstruction(
-    true_anchor_embedding: list[float],
-    true_target_embedding: list[float],
-    guessed_anchor_embedding: list[float],
-    guessed_target_embedding: list[float],
+    true_anchor_embedding: ArrayLike,
+    true_target_embedding: ArrayLike,
+    guessed_anchor_embedding: ArrayLike,
+    guessed_target_embedding: ArrayLike,
     true_anchor: str,
     true_target: str,
     guessed_anchor: str,
@@ -503,26 +596,27 @@ def calculate_reconstruction(
 
     Calculate reconstruction accuracy for backwards compatibility.
     """
-    warnings.warn(
-        "calculate_reconstruction is deprecated and not used in INS-001.2.",
-        DeprecationWarning,
-        stacklevel=2
+    _warn_deprecated(
+        "calculate_reconstruction",
+        "calculate_reconstruction is deprecated and not used in INS-001.2."
     )
 
     FUZZY_EXACT_MATCH_THRESHOLD = 0.99
 
-    true_a = np.array(true_anchor_embedding)
-    true_t = np.array(true_target_embedding)
-    guess_a = np.array(guessed_anchor_embedding)
-    guess_t = np.array(guessed_target_embedding)
+    guessed = np.asarray([guessed_anchor_embedding, guessed_target_embedding], dtype=np.float32)
+    truth = np.asarray([true_anchor_embedding, true_target_embedding], dtype=np.float32)
+
+    # All four guess/truth similarities as one 2x2 matrix:
+    # S[i, j] = sim(guessed_i, truth_j)
+    S = similarity_matrix(guessed, truth)
 
     # Calculate similarities for both orderings
-    sim_a1 = cosine_similarity(guess_a.tolist(), true_a.tolist())
-    sim_t1 = cosine_similarity(guess_t.tolist(), true_t.tolist())
+    sim_a1 = float(S[0, 0])
+    sim_t1 = float(S[1, 1])
     score_ordering1 = (sim_a1 + sim_t1) / 2
 
-    sim_a2 = cosine_similarity(guess_a.tolist(), true_t.tolist())
-    sim_t2 = cosine_similarity(guess_t.tolist(), true_a.tolist())
+    sim_a2 = float(S[0, 1])
+    sim_t2 = float(S[1, 0])
     score_ordering2 = (sim_a2 + sim_t2) / 2
 
     if score_ordering1 >= score_ordering2:
@@ -575,61 +669,58 @@ def calculate_reconstruction(
 
 
 def calculate_bridge_similarity(
-    sender_clue_embeddings: list[list[float]],
-    recipient_clue_embeddings: list[list[float]],
-    anchor_embedding: list[float] | None = None,
-    target_embedding: list[float] | None = None
+    sender_clue_embeddings: ArrayLike,
+    recipient_clue_embeddings: ArrayLike,
+    anchor_embedding: Optional[ArrayLike] = None,
+    target_embedding: Optional[ArrayLike] = None
 ) -> dict:
     """
     DEPRECATED: Use compare_submissions() from scoring.py instead.
 
     Compare two sets of clues for backwards compatibility.
     """
-    warnings.warn(
-        "calculate_bridge_similarity is deprecated. Use compare_submissions from scoring.py instead.",
-        DeprecationWarning,
-        stacklevel=2
+    _warn_deprecated(
+        "calculate_bridge_similarity",
+        "calculate_bridge_similarity is deprecated. Use compare_submissions from scoring.py instead."
     )
 
-    if not sender_clue_embeddings or not recipient_clue_embeddings:
+    if len(sender_clue_embeddings) == 0 or len(recipient_clue_embeddings) == 0:
         return {
             "overall": 0.0,
             "centroid_similarity": 0.0,
             "path_alignment": None
         }
 
-    sender_vecs = [np.array(e) for e in sender_clue_embeddings]
-    recipient_vecs = [np.array(e) for e in recipient_clue_embeddings]
+    # Stack each clue set once into an (N, D) matrix
+    sender_matrix = np.asarray(sender_clue_embeddings, dtype=np.float32)
+    recipient_matrix = np.asarray(recipient_clue_embeddings, dtype=np.float32)
 
-    sender_centroid = np.mean(sender_vecs, axis=0)
-    recipient_centroid = np.mean(recipient_vecs, axis=0)
+    sender_centroid = sender_matrix.mean(axis=0)
+    recipient_centroid = recipient_matrix.mean(axis=0)
 
-    centroid_sim = cosine_similarity(sender_centroid.tolist(), recipient_centroid.tolist())
+    centroid_sim = cosine_similarity(sender_centroid, recipient_centroid)
     centroid_sim_pct = max(0.0, centroid_sim) * 100
 
     path_alignment = None
     if anchor_embedding is not None and target_embedding is not None:
-        anchor_vec = np.array(anchor_embedding)
-        target_vec = np.array(target_embedding)
+        anchor_vec = np.asarray(anchor_embedding, dtype=np.float32)
+        target_vec = np.asarray(target_embedding, dtype=np.float32)
         line_dir = target_vec - anchor_vec
         line_len_sq = np.dot(line_dir, line_dir)
 
+        # Degenerate pair (anchor == target): no line to project onto
         if line_len_sq > 1e-10:
-            def get_perpendicular(centroid):
-                proj_scalar = np.dot(centroid - anchor_vec, line_dir) / line_len_sq
-                proj_point = anchor_vec + proj_scalar * line_dir
-                return centroid - proj_point
-
-            sender_perp = get_perpendicular(sender_centroid)
-            recipient_perp = get_perpendicular(recipient_centroid)
-
-            sender_perp_norm = np.linalg.norm(sender_perp)
-            recipient_perp_norm = np.linalg.norm(recipient_perp)
-
-            if sender_perp_norm > 1e-10 and recipient_perp_norm > 1e-10:
+            # Normalize the line direction once so each projection is a
+            # single dot product: d - (d·u_hat) u_hat
+            # Both centroids are projected together as a (2, D) block
+            u_hat = line_dir / np.sqrt(line_len_sq)
+            offsets = np.stack([sender_centroid, recipient_centroid]) - anchor_vec
+            perps = offsets - np.outer(offsets @ u_hat, u_hat)
+            perp_norms = np.linalg.norm(perps, axis=1)
+
+            if perp_norms[0] > 1e-10 and perp_norms[1] > 1e-10:
                 path_alignment = float(
-                    np.dot(sender_perp, recipient_perp) /
-                    (sender_perp_norm * recipient_perp_norm)
+                    (perps[0] @ perps[1]) / (perp_norms[0] * perp_norms[1])
                 )
 
     return {
@@ -640,18 +731,17 @@ def calculate_bridge_similarity(
 
 
 def calculate_semantic_distance(
-    embedding1: list[float],
-    embedding2: list[float]
+    embedding1: ArrayLike,
+    embedding2: ArrayLike
 ) -> float:
     """
     DEPRECATED: Trivial transform of cosine_similarity.
 
     Calculate semantic distance between two embeddings.
     """
-    warnings.warn(
-        "calculate_semantic_distance is deprecated. Use cosine_similarity instead.",
-        DeprecationWarning,
-        stacklevel=2
+    _warn_deprecated(
+        "calculate_semantic_distance",
+        "calculate_semantic_distance is deprecated. Use cosine_similarity instead."
     )
 
     sim = cosine_similarity(embedding1, embedding2)
@@ -673,10 +763,9 @@ def calculate_statistical_baseline(
 
     Returns a stub result for backwards compatibility.
     """
-    warnings.warn(
-        "calculate_statistical_baseline is deprecated and not used in INS-001.2.",
-        DeprecationWarning,
-        stacklevel=2
+    _warn_deprecated(
+        "calculate_statistical_baseline",
+        "calculate_statistical_baseline is deprecated and not used in INS-001.2."
     )
 
     return {
@@ -687,106 +776,19 @@ def calculate_statistical_baseline(
     }
 
 
+_RECONSTRUCTION_THRESHOLDS = (40, 60, 80)
+_RECONSTRUCTION_LABELS = ("Opaque", "Partial", "Good", "Transparent")
+
+
 def get_reconstruction_interpretation(score: float) -> str:
     """
     DEPRECATED: Not used in INS-001.2.
 
     Get interpretation of reconstruction score for backwards compatibility.
     """
-    warnings.warn(
-        "get_reconstruction_interpretation is deprecated and not used in INS-001.2.",
-        DeprecationWarning,
-        stacklevel=2
+    _warn_deprecated(
+        "get_reconstruction_interpretation",
+        "get_reconstruction_interpretation is deprecated and not used in INS-001.2."
     )
 
-    if score < 40:
-        return "Opaque"
-    elif score < 60:
-        return "Partial"
-    elif score < 80:
-        return "Good"
-    else:
-        return "Transparent"
-
-
-# ============================================
-# TEST CASES - Run with pytest
-# ============================================
-
-def test_morphological_variants():
-    """Test morphological variant detection."""
-    # Basic suffix variants
-    assert _is_morphological_variant("cat", "cats") == True
-    assert _is_morphological_variant("run", "running") == True
-    assert _is_morphological_variant("happy", "happiness") == True
-    assert _is_morphological_variant("cat", "dog") == False
-    assert _is_morphological_variant("cat", "catalyst") == False  # Too different in length
-
-    # Y→I transformations (INS-001.2 bug fix)
-    assert _is_morphological_variant("mystery", "mysteries") == True
-    assert _is_morphological_variant("mystery", "mysterious") == True
-    assert _is_morphological_variant("mystery", "mysteriously") == True  # Chained suffixes
-
-    # Prefix variants (INS-001.2 bug fix)
-    assert _is_morphological_variant("certainty", "uncertainty") == True
-    assert _is_morphological_variant("certain", "uncertain") == True
-    assert _is_morphological_variant("certainty", "uncertain") == True  # Prefix + suffix
-    assert _is_morphological_variant("happy", "unhappy") == True
-    assert _is_morphological_variant("possible", "impossible") == True
-    assert _is_morphological_variant("agree", "disagree") == True
-
-    # Latin root variants (INS-001.2 statistical union fix)
-    # legislation family - all share "legisl" root
-    assert _is_morphological_variant("legislation", "legislative") == True
-    assert _is_morphological_variant("legislation", "legislature") == True
-    assert _is_morphological_variant("legislation", "legislate") == True
-    assert _is_morphological_variant("legislative", "legislature") == True
-    assert _is_morphological_variant("legislative", "legislate") == True
-    # maximum family - both stem to "maxim"
-    assert _is_morphological_variant("maximum", "maximal") == True
-
-    # Non-variants should still return False
-    assert _is_morphological_variant("mystery", "assurance") == False
-    assert _is_morphological_variant("certainty", "doubtless") == False
-    assert _is_morphological_variant("law", "legislation") == False  # Different roots
-    assert _is_morphological_variant("maximum", "minimum") == False  # Different roots
-
-
-def test_word_stem():
-    """Test word stemming."""
-    assert _get_word_stem("running") == "runn"
-    assert _get_word_stem("cats") == "cat"
-    assert _get_word_stem("happiness") == "happi"
-    # Latin-derived suffixes
-    assert _get_word_stem("legislation") == "legisl"
-    assert _get_word_stem("legislative") == "legislat"
-    assert _get_word_stem("legislature") == "legisla"
-    assert _get_word_stem("legislate") == "legisl"
-    assert _get_word_stem("maximum") == "maxim"
-    assert _get_word_stem("maximal") == "maxim"
-
-
-def test_normalize_stem():
-    """Test stem normalization for Y→I handling."""
-    assert _normalize_stem("mystery") == "myster"
-    assert _normalize_stem("mysteries") == "myster"
-    assert _normalize_stem("mysterious") == "myster"
-    assert _normalize_stem("mysteriously") == "myster"  # Chained suffixes
-
-
-def test_strip_prefixes():
-    """Test prefix stripping."""
-    assert _strip_common_prefixes("uncertainty") == "certainty"
-    assert _strip_common_prefixes("unhappy") == "happy"
-    assert _strip_common_prefixes("impossible") == "possible"
-    assert _strip_common_prefixes("disagree") == "agree"
-    # Should not strip if result would be too short
-    assert _strip_common_prefixes("unit") == "unit"
-
-
-if __name__ == "__main__":
-    test_morphological_variants()
-    test_word_stem()
-    test_normalize_stem()
-    test_strip_prefixes()
-    print("All tests passed!")
+    return _RECONSTRUCTION_LABELS[bisect.bisect_right(_RECONSTRUCTION_THRESHOLDS, score)]
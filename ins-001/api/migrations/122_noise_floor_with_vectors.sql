@@ -0,0 +1,46 @@
+-- Migration 122: Return neighbour vectors from the noise-floor search
+--
+-- The lexical-union fallback called get_noise_floor_by_embedding for the
+-- anchor and target, then re-fetched embeddings for every returned word
+-- from OpenAI even though the database already holds them.
+--
+-- get_noise_floor_by_embedding_with_vec is the same search, but also
+-- returns each neighbour's embedding as a float4[] (a plain JSON array
+-- through PostgREST), so the client can score candidates locally without
+-- a second round-trip.
+
+-- ============================================
+-- 1. get_noise_floor_by_embedding_with_vec
+-- ============================================
+DROP FUNCTION IF EXISTS public.get_noise_floor_by_embedding_with_vec(TEXT, TEXT, INT) CASCADE;
+
+CREATE OR REPLACE FUNCTION public.get_noise_floor_by_embedding_with_vec(
+    seed_embedding TEXT,
+    seed_word TEXT,
+    k INT DEFAULT 20
+)
+RETURNS TABLE(word TEXT, similarity FLOAT, embedding REAL[])
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = 'public'
+AS $$
+DECLARE
+    seed_vec vector(1536);
+BEGIN
+    seed_vec := seed_embedding::vector(1536);
+
+    RETURN QUERY
+    SELECT
+        v.word,
+        (1 - (v.embedding <=> seed_vec))::FLOAT as similarity,
+        v.embedding::REAL[] as embedding
+    FROM vocabulary_embeddings v
+    WHERE v.word != lower(seed_word)
+    ORDER BY v.embedding <=> seed_vec
+    LIMIT k;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.get_noise_floor_by_embedding_with_vec(TEXT, TEXT, INT) TO authenticated, service_role;
+
+SELECT 'Migration 122: get_noise_floor_by_embedding_with_vec created' as status;
@@ -0,0 +1,28 @@
+-- Migration 123: Single-statement vocabulary reset
+--
+-- scripts/embed_vocabulary.py --clean emptied vocabulary_embeddings by
+-- selecting 1,000 words at a time and deleting them with an IN list,
+-- roughly 30 round-trips for the curated 30K vocabulary.
+--
+-- truncate_vocabulary_embeddings() empties the table in one statement.
+-- It is restricted to service_role (the embedding script's key).
+
+-- ============================================
+-- 1. truncate_vocabulary_embeddings
+-- ============================================
+DROP FUNCTION IF EXISTS public.truncate_vocabulary_embeddings() CASCADE;
+
+CREATE OR REPLACE FUNCTION public.truncate_vocabulary_embeddings()
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+BEGIN
+    TRUNCATE TABLE public.vocabulary_embeddings;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.truncate_vocabulary_embeddings() TO service_role;
+
+SELECT 'Migration 123: truncate_vocabulary_embeddings created' as status;
@@ -0,0 +1,31 @@
+-- Migration 124: Drop the vocabulary IVFFlat index before bulk loads
+--
+-- scripts/embed_vocabulary.py upserts ~30K rows and then rebuilds the
+-- index with recreate_vocabulary_index(). With the index live, every
+-- upsert also maintains it, and IVFFlat lists built on a partial table
+-- cluster poorly anyway.
+--
+-- drop_vocabulary_index() drops it up front so the load runs without
+-- index maintenance and the index is built once, on the full table.
+-- It is restricted to service_role (the embedding script's key).
+
+-- ============================================
+-- 1. drop_vocabulary_index
+-- ============================================
+DROP FUNCTION IF EXISTS public.drop_vocabulary_index() CASCADE;
+
+CREATE OR REPLACE FUNCTION public.drop_vocabulary_index()
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+BEGIN
+    DROP INDEX IF EXISTS public.idx_vocab_embedding;
+    DROP INDEX IF EXISTS public.vocabulary_embeddings_embedding_idx;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.drop_vocabulary_index() TO service_role;
+
+SELECT 'Migration 124: drop_vocabulary_index created' as status;
@@ -7,26 +7,43 @@ Builds a curated vocabulary from multiple sources:
 3. Filtered to remove symbols, numbers, and words < 3 characters
 
 Usage:
-    python scripts/embed_vocabulary.py [--clean] [--dry-run]
+    python scripts/embed_vocabulary.py [--clean] [--dry-run] [--verbose] [--copy]
 
 Options:
-    --clean    Delete all existing vocabulary before inserting
+    --clean    Delete all existing vocabulary before inserting (without it,
+               words already in the table are skipped, so an interrupted
+               run resumes where it stopped)
     --dry-run  Show what would be inserted without actually inserting
+    --verbose  Print per-part-of-speech WordNet counts
+    --copy     Load each batch with COPY over a direct Postgres connection
+               instead of REST upserts (needs psycopg and DATABASE_URL);
+               with --dry-run, COPYs sample rows into the temp staging
+               table only (vocabulary_embeddings is never written)
+
+The filtered WordNet lemma set is cached in ~/.cache/ins-001/ after the
+first run; delete the .pkl file there to force a rebuild.
 
 Requirements:
     - nltk: pip install nltk
     - wordfreq: pip install wordfreq
     - OPENAI_API_KEY environment variable
     - SUPABASE_URL and SUPABASE_SERVICE_KEY environment variables
+    - For --copy: psycopg (pip install "psycopg[binary]") and DATABASE_URL
 """
 
 import os
 import sys
 import asyncio
+import gzip
+import json
+import pickle
 import re
 import time
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Set, Dict, List, Tuple
+from typing import Set, Dict, List
 from dotenv import load_dotenv
 
 # Load environment variables from custom location if specified
@@ -46,31 +63,72 @@ else:
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from openai import AsyncOpenAI
+import httpx
+import numpy as np
+from openai import AsyncOpenAI, RateLimitError
 from supabase import create_client, Client
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+# Optional fast JSON encoder for upsert payloads (stdlib json if missing).
+# Embeddings are float32 ndarray rows: orjson writes each component with
+# its shortest float32 repr, which is lossless for the vector(1536) column.
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), default=lambda o: o.tolist()).encode()
+
+# Optional direct Postgres driver for --copy loads
+try:
+    import psycopg
+except ImportError:
+    psycopg = None
 
 # Get env vars directly
 SUPABASE_URL = os.environ.get("SUPABASE_URL")
 SUPABASE_SERVICE_KEY = os.environ.get("SUPABASE_SERVICE_KEY")
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
+DATABASE_URL = os.environ.get("DATABASE_URL")  # Only needed for --copy
 EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_DIMENSIONS = 1536  # vocabulary_embeddings.embedding is vector(1536)
 
 # Configuration
 BATCH_SIZE = 2000  # OpenAI limit is 2048 per call
 CHUNK_SIZE = 50    # DB insert chunk size to avoid timeout
+MAX_CONCURRENT_BATCHES = 8  # Embedding requests in flight (OpenAI rate limits)
+MAX_CONCURRENT_INSERTS = 4  # Batches upserting at once (DB write load)
 MIN_WORD_LENGTH = 3
 MAX_WORD_LENGTH = 25
 TARGET_VOCABULARY_SIZE = 30000  # Curated size (smaller but higher quality)
+WORDNET_CACHE_DIR = Path.home() / ".cache" / "ins-001"
+WORDNET_CACHE_VERSION = 1  # Bump when is_valid_word's rules change
+
+# Alphabetic words, allowing hyphens and apostrophes inside compound words
+_WORD_RE = re.compile(r"^[a-zA-Z]+(?:[-'][a-zA-Z]+)*$")
+
+# All-caps abbreviations that are still worth keeping
+_COMMON_ACRONYMS = frozenset({'usa', 'uk', 'tv', 'dna', 'fbi', 'cia', 'nasa', 'aids'})
 
 # Initialize clients (will be set in main)
 openai_client = None
 supabase = None
+rest_client = None  # Shared PostgREST connection for bulk upserts
+gzip_uploads = True  # Cleared if the server rejects gzip request bodies
+
+# Error text identifying a 400 as an undecodable body rather than a bad row
+_ENCODING_ERROR_MARKERS = ("pgrst102", "invalid json", "content-encoding")
 
 
 # ============================================
 # WORD FILTERING
 # ============================================
 
+# WordNet repeats a lemma once per synset it belongs to, and wordfreq
+# overlaps heavily with WordNet, so most calls are repeats
+@lru_cache(maxsize=None)
 def is_valid_word(word: str) -> bool:
     """
     Filter out junk words that don't add semantic value.
@@ -82,28 +140,28 @@ def is_valid_word(word: str) -> bool:
     - Words longer than 25 characters
     - Words with special characters
     - Abbreviations that are all caps (except common ones)
-    """
-    if not word:
-        return False
-
-    word = word.strip()
 
-    # Length check
+    Called once per source token (~170K), so callers pass already-stripped
+    words (WordNet and wordfreq tokens carry no surrounding whitespace).
+    """
+    # Length check (cheapest, also rejects empty strings)
     if len(word) < MIN_WORD_LENGTH or len(word) > MAX_WORD_LENGTH:
         return False
 
-    # Must be alphabetic (allows hyphens and apostrophes for compound words)
-    if not re.match(r"^[a-zA-Z]+(?:[-'][a-zA-Z]+)*$", word):
-        return False
+    # Fast path for plain ASCII words (nearly all of wordfreq): only the
+    # all-caps rule applies, no regex needed
+    if word.isascii() and word.isalpha():
+        return not word.isupper() or word.lower() in _COMMON_ACRONYMS
 
     # Filter out all-caps abbreviations (keep common ones)
-    common_acronyms = {'usa', 'uk', 'tv', 'dna', 'fbi', 'cia', 'nasa', 'aids'}
-    if word.isupper() and word.lower() not in common_acronyms:
+    if word.isupper() and word.lower() not in _COMMON_ACRONYMS:
         return False
 
-    return True
+    # Must be alphabetic (allows hyphens and apostrophes for compound words)
+    return _WORD_RE.match(word) is not None
 
 
+@lru_cache(maxsize=None)
 def normalize_word(word: str) -> str:
     """Normalize a word for consistent storage."""
     return word.lower().strip()
@@ -113,12 +171,16 @@ def normalize_word(word: str) -> str:
 # VOCABULARY SOURCES
 # ============================================
 
-def load_wordnet_lemmas() -> Set[str]:
+def load_wordnet_lemmas(verbose: bool = False) -> Set[str]:
     """
     Load all lemmas from WordNet (nouns, verbs, adjectives, adverbs).
 
     WordNet provides semantically meaningful words organized by meaning.
     ~118,000 unique lemmas total.
+
+    Args:
+        verbose: Also report per-part-of-speech counts (a second pass
+            over the synsets)
     """
     try:
         import nltk
@@ -132,21 +194,43 @@ def load_wordnet_lemmas() -> Set[str]:
             nltk.download('wordnet', quiet=True)
             nltk.download('omw-1.4', quiet=True)
 
-        lemmas = set()
-        pos_counts = {'n': 0, 'v': 0, 'a': 0, 'r': 0}
-
-        for synset in wn.all_synsets():
-            pos = synset.pos()
-            for lemma in synset.lemmas():
-                # WordNet uses underscores for multi-word terms
-                word = lemma.name().replace('_', '-')
-                if is_valid_word(word):
-                    lemmas.add(normalize_word(word))
-                    pos_counts[pos] = pos_counts.get(pos, 0) + 1
+        # Walking every synset takes several seconds, so the filtered set is
+        # cached per WordNet version and length limits
+        cache_path = WORDNET_CACHE_DIR / (
+            f"wordnet_lemmas_v{WORDNET_CACHE_VERSION}_{wn.get_version()}"
+            f"_{MIN_WORD_LENGTH}-{MAX_WORD_LENGTH}.pkl"
+        )
 
-        print(f"  WordNet: {len(lemmas)} valid lemmas")
-        print(f"    Nouns: ~{pos_counts['n']}, Verbs: ~{pos_counts['v']}, "
-              f"Adj: ~{pos_counts['a']}, Adv: ~{pos_counts['r']}")
+        if cache_path.exists():
+            lemmas = pickle.loads(cache_path.read_bytes())
+            print(f"  WordNet: {len(lemmas)} valid lemmas (cached: {cache_path})")
+        else:
+            # WordNet uses underscores for multi-word terms. Lemma names carry
+            # no surrounding whitespace, so lower() is all normalize_word does.
+            lemmas = {
+                word.lower()
+                for synset in wn.all_synsets()
+                for lemma in synset.lemmas()
+                if is_valid_word(word := lemma.name().replace('_', '-'))
+            }
+
+            print(f"  WordNet: {len(lemmas)} valid lemmas")
+
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_bytes(pickle.dumps(lemmas, protocol=5))
+            except OSError as e:
+                print(f"  WARNING: could not cache WordNet lemmas: {e}")
+
+        if verbose:
+            pos_counts = Counter(
+                synset.pos()
+                for synset in wn.all_synsets()
+                for lemma in synset.lemmas()
+                if is_valid_word(lemma.name().replace('_', '-'))
+            )
+            print(f"    Nouns: ~{pos_counts['n']}, Verbs: ~{pos_counts['v']}, "
+                  f"Adj: ~{pos_counts['a']}, Adv: ~{pos_counts['r']}")
 
         return lemmas
 
@@ -156,34 +240,35 @@ def load_wordnet_lemmas() -> Set[str]:
         return set()
 
 
-def load_wordfreq_words(top_n: int = 50000) -> List[Tuple[str, int]]:
+def load_wordfreq_words(top_n: int = 50000) -> Dict[str, int]:
     """
     Load top N words from wordfreq with their frequency ranks.
 
     wordfreq provides frequency-ranked words from real usage data.
-    Returns list of (word, rank) tuples for words that pass filtering.
+    Returns a {word: rank} map for words that pass filtering.
     """
     try:
-        from wordfreq import top_n_list
-
-        raw_words = top_n_list('en', top_n)
-        ranked_words = []
+        from wordfreq import iter_wordlist
 
-        for rank, word in enumerate(raw_words, 1):
-            if is_valid_word(word):
-                ranked_words.append((normalize_word(word), rank))
+        # Stream the frequency-ordered list (what top_n_list slices) rather
+        # than materialising the top-N list first; ranks are unchanged
+        freq_map = {
+            normalize_word(word): rank
+            for rank, word in enumerate(islice(iter_wordlist('en'), top_n), 1)
+            if is_valid_word(word)
+        }
 
-        print(f"  wordfreq: {len(ranked_words)} valid words (from top {top_n})")
+        print(f"  wordfreq: {len(freq_map)} valid words (from top {top_n})")
 
-        return ranked_words
+        return freq_map
 
     except ImportError:
         print("  WARNING: wordfreq not installed, skipping")
         print("  Install with: pip install wordfreq")
-        return []
+        return {}
 
 
-def build_curated_vocabulary() -> List[Dict]:
+def build_curated_vocabulary(verbose: bool = False) -> List[Dict]:
     """
     Build curated vocabulary combining multiple sources.
 
@@ -199,17 +284,13 @@ def build_curated_vocabulary() -> List[Dict]:
 
     # Load sources
     print("Loading WordNet lemmas...")
-    wordnet_lemmas = load_wordnet_lemmas()
+    wordnet_lemmas = load_wordnet_lemmas(verbose=verbose)
 
     print("\nLoading wordfreq words...")
-    wordfreq_ranked = load_wordfreq_words(top_n=50000)
-
-    # Build frequency map from wordfreq
-    freq_map = {word: rank for word, rank in wordfreq_ranked}
+    freq_map = load_wordfreq_words(top_n=50000)
 
     # Combine all words
-    all_words = set(wordnet_lemmas)
-    all_words.update(word for word, _ in wordfreq_ranked)
+    all_words = wordnet_lemmas | freq_map.keys()
 
     print(f"\nTotal unique words after merge: {len(all_words)}")
 
@@ -253,8 +334,14 @@ def build_curated_vocabulary() -> List[Dict]:
 # EMBEDDING & DATABASE
 # ============================================
 
+@retry(
+    retry=retry_if_exception_type(RateLimitError),
+    wait=wait_exponential(multiplier=1, min=2, max=60),
+    stop=stop_after_attempt(6),
+    reraise=True
+)
 async def get_embeddings_batch(texts: list[str]) -> list[list[float]]:
-    """Get embeddings for a batch of texts."""
+    """Get embeddings for a batch of texts (backs off on 429s)."""
     response = await openai_client.embeddings.create(
         model=EMBEDDING_MODEL,
         input=texts
@@ -265,6 +352,15 @@ async def get_embeddings_batch(texts: list[str]) -> list[list[float]]:
 async def clean_vocabulary_table():
     """Delete all existing vocabulary entries."""
     print("\nCleaning vocabulary table...")
+
+    # One TRUNCATE statement (migration 123)
+    try:
+        supabase.rpc("truncate_vocabulary_embeddings").execute()
+        print("  ✓ Table cleaned")
+        return
+    except Exception as e:
+        print(f"  ⚠ truncate_vocabulary_embeddings failed: {e}, deleting in batches")
+
     try:
         # Delete in batches to avoid timeout
         while True:
@@ -290,14 +386,223 @@ async def clean_vocabulary_table():
         raise
 
 
-async def embed_and_insert_vocabulary(vocabulary: List[Dict], dry_run: bool = False):
-    """Embed vocabulary words and insert into database."""
+def _is_encoding_rejection(response: httpx.Response) -> bool:
+    """
+    True if the server refused a gzip body because it can't decode it.
+
+    Either an explicit 415, or a 400 whose error is a JSON parse failure
+    (PostgREST PGRST102, "Empty or invalid json"), which is what it returns
+    when handed compressed bytes. Other 400s are real row errors.
+    """
+    if response.status_code == 415:
+        return True
+    if response.status_code != 400:
+        return False
+    error_text = response.text.lower()
+    return any(marker in error_text for marker in _ENCODING_ERROR_MARKERS)
+
+
+def upsert_rows(rows) -> None:
+    """
+    Upsert one or more vocabulary rows straight through PostgREST.
+
+    Each chunk is ~600KB of floats: orjson encodes it several times faster
+    than the stdlib encoder the Supabase client uses, and the shared
+    httpx client keeps one connection alive across all chunks.
+    """
+    global gzip_uploads
+
+    body = _json_dumps(rows)
+
+    if gzip_uploads:
+        # Float JSON compresses ~2x at level 1 (~20ms per chunk)
+        response = rest_client.post(
+            "/vocabulary_embeddings",
+            params={"on_conflict": "word"},
+            content=gzip.compress(body, compresslevel=1),
+            headers={"Content-Encoding": "gzip"}
+        )
+        if not _is_encoding_rejection(response):
+            response.raise_for_status()
+            return
+        # Gateway doesn't decode gzip request bodies: send plain from now on
+        gzip_uploads = False
+        print(f"    ⚠ Compressed upload rejected ({response.status_code}), sending uncompressed")
+
+    response = rest_client.post(
+        "/vocabulary_embeddings",
+        params={"on_conflict": "word"},
+        content=body
+    )
+    response.raise_for_status()
+
+
+def fetch_existing_words() -> Set[str]:
+    """Fetch every word already in vocabulary_embeddings (paged by word, 1,000 rows at a time)."""
+    existing = set()
+    offset = 0
+    while True:
+        result = supabase.table("vocabulary_embeddings") \
+            .select("word") \
+            .order("word") \
+            .range(offset, offset + 999) \
+            .execute()
+        if not result.data:
+            break
+        existing.update(r["word"] for r in result.data)
+        if len(result.data) < 1000:
+            break
+        offset += 1000
+    return existing
+
+
+def insert_records(records: List[Dict], batch_num: int) -> int:
+    """
+    Upsert one batch of records in chunks (blocking; run via to_thread).
+
+    Returns the number of records inserted.
+    """
+    inserted_count = 0
+    total_chunks = (len(records) + CHUNK_SIZE - 1) // CHUNK_SIZE
+
+    for chunk_start in range(0, len(records), CHUNK_SIZE):
+        chunk = records[chunk_start:chunk_start + CHUNK_SIZE]
+        chunk_num = chunk_start // CHUNK_SIZE + 1
+
+        try:
+            upsert_rows(chunk)
+            inserted_count += len(chunk)
+
+            if chunk_num % 10 == 0:
+                print(f"    Batch {batch_num}: chunk {chunk_num}/{total_chunks}")
+
+        except Exception as chunk_error:
+            print(f"    ⚠ Batch {batch_num} chunk {chunk_num} failed: {chunk_error}")
+            # Retry individually
+            for record in chunk:
+                try:
+                    upsert_rows(record)
+                    inserted_count += 1
+                except Exception:
+                    print(f"      Failed: {record.get('word', 'unknown')}")
+            time.sleep(0.1)
+
+    return inserted_count
+
+
+def _copy_to_staging(cur, records: List[Dict]) -> None:
+    """COPY records into a transaction-scoped tmp_vocab staging table."""
+    # Only the three loaded columns, with the live table's exact types
+    # (no ids, defaults or constraints to satisfy in the staging table)
+    cur.execute(
+        "CREATE TEMP TABLE tmp_vocab ON COMMIT DROP AS "
+        "SELECT word, embedding, frequency_rank "
+        "FROM public.vocabulary_embeddings WITH NO DATA"
+    )
+
+    # Embedding JSON arrays are valid pgvector text literals
+    with cur.copy("COPY tmp_vocab (word, embedding, frequency_rank) FROM STDIN") as copy:
+        for record in records:
+            copy.write_row((
+                record["word"],
+                _json_dumps(record["embedding"]).decode(),
+                record["frequency_rank"]
+            ))
+
+
+def check_copy_staging(records: List[Dict]) -> int:
+    """
+    COPY records into the staging table only and discard them (--dry-run --copy).
+
+    Checks the connection, column types and vector literals without
+    writing to or locking rows in vocabulary_embeddings.
+
+    Returns the number of rows staged.
+    """
+    with psycopg.connect(DATABASE_URL) as conn:
+        with conn.cursor() as cur:
+            _copy_to_staging(cur, records)
+            cur.execute("SELECT count(*) FROM tmp_vocab")
+            staged_count = cur.fetchone()[0]
+        conn.rollback()
+    return staged_count
+
+
+def copy_records(records: List[Dict], batch_num: int) -> int:
+    """
+    Load one batch with COPY and a single upsert (blocking; run via to_thread).
+
+    Rows are streamed into a temp table, then merged into
+    vocabulary_embeddings in one statement, all in one transaction.
+
+    Args:
+        records: {word, embedding, frequency_rank} rows
+        batch_num: Batch number for progress output
+
+    Returns the number of records inserted or updated.
+    """
+    with psycopg.connect(DATABASE_URL) as conn:
+        with conn.cursor() as cur:
+            _copy_to_staging(cur, records)
+
+            cur.execute(
+                "INSERT INTO public.vocabulary_embeddings (word, embedding, frequency_rank) "
+                "SELECT word, embedding, frequency_rank FROM tmp_vocab "
+                "ON CONFLICT (word) DO UPDATE "
+                "SET embedding = EXCLUDED.embedding, frequency_rank = EXCLUDED.frequency_rank"
+            )
+            inserted_count = cur.rowcount
+
+    print(f"    Batch {batch_num}: copied {inserted_count} rows")
+    return inserted_count
+
+
+async def embed_and_insert_vocabulary(
+    vocabulary: List[Dict],
+    dry_run: bool = False,
+    use_copy: bool = False,
+    skip_existing: bool = False
+):
+    """
+    Embed vocabulary words and insert into database.
+
+    Args:
+        vocabulary: {word, frequency_rank} entries to embed
+        dry_run: Only report what would be inserted
+        use_copy: Load batches with COPY over DATABASE_URL instead of REST
+        skip_existing: Skip words already in the table (resume), so their
+            embeddings are not paid for again
+    """
+    if skip_existing:
+        existing = await asyncio.to_thread(fetch_existing_words)
+        remaining = [v for v in vocabulary if v["word"] not in existing]
+        print(f"\nSkipping {len(vocabulary) - len(remaining)} words already embedded")
+        vocabulary = remaining
 
     if dry_run:
         print("\n=== DRY RUN - No changes will be made ===")
         print(f"\nWould insert {len(vocabulary)} words:")
         print(f"  First 10: {[v['word'] for v in vocabulary[:10]]}")
         print(f"  Last 10: {[v['word'] for v in vocabulary[-10:]]}")
+
+        if use_copy and vocabulary:
+            # COPY placeholder vectors into the temp staging table only;
+            # the merge into vocabulary_embeddings is skipped
+            print("\nChecking COPY staging (temp table only)...")
+            sample = [
+                {
+                    "word": v["word"],
+                    "embedding": np.zeros(EMBEDDING_DIMENSIONS, dtype=np.float32),
+                    "frequency_rank": v["frequency_rank"]
+                }
+                for v in vocabulary[:10]
+            ]
+            staged = await asyncio.to_thread(check_copy_staging, sample)
+            print(f"  ✓ COPY staging OK ({staged} rows)")
+        return
+
+    if not vocabulary:
+        print("\nNothing to embed: vocabulary is already loaded")
         return
 
     total_words = len(vocabulary)
@@ -307,77 +612,76 @@ async def embed_and_insert_vocabulary(vocabulary: List[Dict], dry_run: bool = Fa
     print(f"  Batches: {total_batches}")
     print(f"  Estimated cost: ~${total_words * 0.00001:.2f}")
 
-    inserted_count = 0
-
-    for i in range(0, total_words, BATCH_SIZE):
-        batch = vocabulary[i:i+BATCH_SIZE]
-        batch_num = i // BATCH_SIZE + 1
+    # Load without the IVFFlat index (migration 124); it is rebuilt once,
+    # on the full table, by recreate_vocabulary_index() at the end
+    print("\nDropping IVFFlat index for bulk load...")
+    try:
+        supabase.rpc("drop_vocabulary_index").execute()
+        print("  ✓ Index dropped")
+    except Exception as e:
+        print(f"  ⚠ Could not drop index, loading with it in place: {e}")
 
-        print(f"\nBatch {batch_num}/{total_batches} ({len(batch)} words)...")
+    # Embedding requests are network-bound, so several batches are fetched
+    # concurrently. A batch releases its fetch slot as soon as its
+    # embeddings arrive and then upserts in a worker thread (blocking HTTP),
+    # so inserts overlap with later fetches. Each stream has its own limit.
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+    insert_semaphore = asyncio.Semaphore(MAX_CONCURRENT_INSERTS)
 
+    async def process_batch(batch_num: int, batch: List[Dict]) -> int:
         try:
-            # Get embeddings
             words = [v["word"] for v in batch]
-            print("  Fetching embeddings from OpenAI...")
-            embeddings = await get_embeddings_batch(words)
+            async with semaphore:
+                print(f"\nBatch {batch_num}/{total_batches}: fetching {len(batch)} embeddings...")
+                embeddings = await get_embeddings_batch(words)
+
+                # The column stores float4, so keep float32: ~6KB per vector
+                # instead of ~49KB as Python floats. Fetches run ahead of
+                # inserts, so finished batches wait here in compact form.
+                embedding_matrix = np.asarray(embeddings, dtype=np.float32)
+                del embeddings
 
             # Prepare records
-            records = []
-            for vocab_entry, embedding in zip(batch, embeddings):
-                records.append({
+            records = [
+                {
                     "word": vocab_entry["word"],
                     "embedding": embedding,
                     "frequency_rank": vocab_entry["frequency_rank"]
-                })
+                }
+                for vocab_entry, embedding in zip(batch, embedding_matrix)
+            ]
 
-            # Insert in chunks
-            print(f"  Inserting {len(records)} records...")
-            for chunk_start in range(0, len(records), CHUNK_SIZE):
-                chunk = records[chunk_start:chunk_start + CHUNK_SIZE]
-                chunk_num = chunk_start // CHUNK_SIZE + 1
-                total_chunks = (len(records) + CHUNK_SIZE - 1) // CHUNK_SIZE
-
-                try:
-                    supabase.table("vocabulary_embeddings").upsert(
-                        chunk,
-                        on_conflict="word"
-                    ).execute()
-                    inserted_count += len(chunk)
-
-                    if chunk_num % 10 == 0:
-                        print(f"    Chunk {chunk_num}/{total_chunks}")
-
-                except Exception as chunk_error:
-                    print(f"    ⚠ Chunk {chunk_num} failed: {chunk_error}")
-                    # Retry individually
-                    for record in chunk:
-                        try:
-                            supabase.table("vocabulary_embeddings").upsert(
-                                record,
-                                on_conflict="word"
-                            ).execute()
-                            inserted_count += 1
-                        except Exception:
-                            print(f"      Failed: {record.get('word', 'unknown')}")
-                    time.sleep(0.1)
-
-            print(f"  ✓ Batch {batch_num} complete")
+            async with insert_semaphore:
+                load = copy_records if use_copy else insert_records
+                inserted = await asyncio.to_thread(load, records, batch_num)
+            print(f"  ✓ Batch {batch_num} complete ({inserted}/{len(records)} inserted)")
+            return inserted
 
         except Exception as e:
             print(f"  ✗ Error in batch {batch_num}: {e}")
-            continue
-
-    print(f"\n✓ Vocabulary embedding complete!")
-    print(f"  Inserted: {inserted_count} words")
+            return 0
 
-    # Recreate index
-    print("\nRecreating IVFFlat index...")
+    # The index was dropped above, so it must be rebuilt even if the load
+    # fails or is interrupted; otherwise every vector RPC falls back to a
+    # sequential scan
     try:
-        supabase.rpc("recreate_vocabulary_index").execute()
-        print("  ✓ Index recreated")
-    except Exception as e:
-        print(f"  ⚠ Could not recreate index: {e}")
-        print("  Run manually: SELECT recreate_vocabulary_index();")
+        inserted_counts = await asyncio.gather(*(
+            process_batch(i // BATCH_SIZE + 1, vocabulary[i:i+BATCH_SIZE])
+            for i in range(0, total_words, BATCH_SIZE)
+        ))
+        inserted_count = sum(inserted_counts)
+
+        print(f"\n✓ Vocabulary embedding complete!")
+        print(f"  Inserted: {inserted_count} words")
+
+    finally:
+        print("\nRecreating IVFFlat index...")
+        try:
+            supabase.rpc("recreate_vocabulary_index").execute()
+            print("  ✓ Index recreated")
+        except Exception as e:
+            print(f"  ⚠ Could not recreate index: {e}")
+            print("  Run manually: SELECT recreate_vocabulary_index();")
 
 
 # ============================================
@@ -385,15 +689,31 @@ async def embed_and_insert_vocabulary(vocabulary: List[Dict], dry_run: bool = Fa
 # ============================================
 
 async def main():
-    global openai_client, supabase
+    global openai_client, supabase, rest_client
 
     # Parse args
     clean_first = "--clean" in sys.argv
     dry_run = "--dry-run" in sys.argv
+    verbose = "--verbose" in sys.argv
+    use_copy = "--copy" in sys.argv
+
+    if use_copy and (psycopg is None or not DATABASE_URL):
+        print("ERROR: --copy needs psycopg installed and DATABASE_URL set")
+        sys.exit(1)
 
     # Initialize clients
     openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
     supabase = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+    rest_client = httpx.Client(
+        base_url=f"{SUPABASE_URL}/rest/v1",
+        headers={
+            "apikey": SUPABASE_SERVICE_KEY,
+            "Authorization": f"Bearer {SUPABASE_SERVICE_KEY}",
+            "Content-Type": "application/json",
+            "Prefer": "resolution=merge-duplicates,return=minimal",
+        },
+        timeout=60.0
+    )
 
     print("=" * 60)
     print("INS-001 Curated Vocabulary Embedding Script")
@@ -402,17 +722,26 @@ async def main():
     print(f"Min length: {MIN_WORD_LENGTH}, Max length: {MAX_WORD_LENGTH}")
     print(f"Clean first: {clean_first}")
     print(f"Dry run: {dry_run}")
+    print(f"Load via: {'COPY' if use_copy else 'REST upsert'}")
     print("=" * 60)
 
     # Build vocabulary
-    vocabulary = build_curated_vocabulary()
+    vocabulary = build_curated_vocabulary(verbose=verbose)
 
     # Clean if requested
     if clean_first and not dry_run:
         await clean_vocabulary_table()
 
     # Embed and insert
-    await embed_and_insert_vocabulary(vocabulary, dry_run=dry_run)
+    try:
+        await embed_and_insert_vocabulary(
+            vocabulary,
+            dry_run=dry_run,
+            use_copy=use_copy,
+            skip_existing=not clean_first
+        )
+    finally:
+        rest_client.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,161 @@
+"""
+Tests for app.services.cache.lexical_union_cache (statistical union LRU cache).
+
+Run from ins-001/api:
+    python -m pytest tests/test_lexical_union_cache.py
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from app.services.cache import LexicalUnionCache, VocabularyPool
+from app.services.cache import lexical_union_cache
+
+
+def test_get_put_normalizes_key():
+    """Test hits are keyed by normalized anchor/target and num_concepts."""
+    cache = LexicalUnionCache()
+    cache.put(" Ocean", "MYSTERY ", 3, ["wave", "depth", "abyss"])
+
+    assert cache.get("ocean", "mystery", 3) == ["wave", "depth", "abyss"]
+    assert cache.get("ocean", "mystery", 4) is None
+    # Direction matters: anchor → target
+    assert cache.get("mystery", "ocean", 3) is None
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["size"] == 1
+
+
+def test_results_are_copies():
+    """Test callers mutating results can't corrupt cached entries."""
+    cache = LexicalUnionCache()
+    union_words = ["wave", "depth"]
+    cache.put("ocean", "mystery", 2, union_words)
+
+    union_words.append("stored-list-mutated")
+    first = cache.get("ocean", "mystery", 2)
+    first.append("returned-list-mutated")
+
+    assert cache.get("ocean", "mystery", 2) == ["wave", "depth"]
+
+
+def test_ttl_expiry(monkeypatch):
+    """Test entries expire after ttl_seconds and are evicted on access."""
+    now = [1000.0]
+    monkeypatch.setattr(lexical_union_cache.time, "time", lambda: now[0])
+
+    cache = LexicalUnionCache(ttl_seconds=60)
+    cache.put("ocean", "mystery", 2, ["wave", "depth"])
+
+    now[0] += 60
+    assert cache.get("ocean", "mystery", 2) == ["wave", "depth"]
+
+    now[0] += 1
+    assert cache.get("ocean", "mystery", 2) is None
+    assert cache.get_stats()["size"] == 0
+
+
+def test_lru_eviction():
+    """Test the least recently used entry is evicted at capacity."""
+    cache = LexicalUnionCache(max_size=2)
+    cache.put("a", "b", 1, ["x"])
+    cache.put("c", "d", 1, ["y"])
+
+    # Touch a→b so c→d becomes least recently used
+    assert cache.get("a", "b", 1) == ["x"]
+    cache.put("e", "f", 1, ["z"])
+
+    assert cache.get("c", "d", 1) is None
+    assert cache.get("a", "b", 1) == ["x"]
+    assert cache.get("e", "f", 1) == ["z"]
+    assert cache.get_stats()["size"] == 2
+
+
+def test_overwrite_does_not_evict():
+    """Test re-putting a cached key at capacity keeps other entries and refreshes recency."""
+    cache = LexicalUnionCache(max_size=2)
+    cache.put("a", "b", 1, ["x"])
+    cache.put("c", "d", 1, ["y"])
+
+    # Overwrite a→b: c→d must survive and become least recently used
+    cache.put("a", "b", 1, ["x2"])
+    assert cache.get_stats()["size"] == 2
+    cache.put("e", "f", 1, ["z"])
+
+    assert cache.get("c", "d", 1) is None
+    assert cache.get("a", "b", 1) == ["x2"]
+    assert cache.get("e", "f", 1) == ["z"]
+
+
+def test_singleton_and_clear():
+    """Test get_instance is a singleton and clear drops entries and stats."""
+    LexicalUnionCache.reset_instance()
+    try:
+        cache = LexicalUnionCache.get_instance()
+        assert LexicalUnionCache.get_instance() is cache
+
+        cache.put("ocean", "mystery", 2, ["wave", "depth"])
+        cache.get("ocean", "mystery", 2)
+        cache.clear()
+
+        assert cache.get_stats() == {
+            "hits": 0, "misses": 0, "size": 0, "max_size": cache.DEFAULT_MAX_SIZE, "hit_rate": 0
+        }
+    finally:
+        LexicalUnionCache.reset_instance()
+
+
+class _FakeQuery:
+    """Minimal stand-in for a Supabase table query (select/order/range/execute)."""
+
+    def __init__(self, rows):
+        self._rows = rows
+        self._count = None
+        self._start = 0
+        self._end = len(rows) - 1
+
+    def select(self, columns, count=None):
+        self._count = count
+        return self
+
+    def order(self, column):
+        self._rows = sorted(self._rows, key=lambda row: row[column])
+        return self
+
+    def range(self, start, end):
+        self._start, self._end = start, end
+        return self
+
+    def execute(self):
+        page = self._rows[self._start:self._end + 1]
+        count = len(self._rows) if self._count else None
+        return SimpleNamespace(data=page, count=count)
+
+
+class _FakeSupabase:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def table(self, name):
+        return _FakeQuery(self._rows)
+
+
+def test_cleared_when_vocabulary_reloads():
+    """Test a VocabularyPool (re)load drops unions ranked against the old vocabulary."""
+    LexicalUnionCache.reset_instance()
+    VocabularyPool.reset_instance()
+    try:
+        cache = LexicalUnionCache.get_instance()
+        cache.put("ocean", "mystery", 2, ["wave", "depth"])
+
+        pool = VocabularyPool.get_instance()
+        rows = [{"word": "wave"}, {"word": "depth"}, {"word": "abyss"}]
+        asyncio.run(pool.initialize(_FakeSupabase(rows)))
+
+        assert pool.size == 3
+        assert cache.get("ocean", "mystery", 2) is None
+    finally:
+        LexicalUnionCache.reset_instance()
+        VocabularyPool.reset_instance()
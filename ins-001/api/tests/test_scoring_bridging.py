@@ -0,0 +1,225 @@
+"""
+Tests for app.services.scoring_bridging (INS-001.2 bridging utilities).
+
+Run from ins-001/api:
+    python -m pytest tests/test_scoring_bridging.py
+"""
+
+import json
+import warnings
+
+import numpy as np
+
+from app.services.scoring_bridging import (
+    _filter_union_candidates,
+    _get_word_stem,
+    _is_morphological_variant,
+    _normalize_stem,
+    _STEM_SUFFIXES,
+    _STRIP_PREFIXES,
+    _strip_common_prefixes,
+    _vector_literal,
+    calculate_binding_strength,
+    calculate_bridge_similarity,
+    calculate_reconstruction,
+    calculate_semantic_distance,
+)
+from app.services import scoring
+
+
+def test_morphological_variants():
+    """Test morphological variant detection."""
+    # Basic suffix variants
+    assert _is_morphological_variant("cat", "cats") == True
+    assert _is_morphological_variant("run", "running") == True
+    assert _is_morphological_variant("happy", "happiness") == True
+    assert _is_morphological_variant("cat", "dog") == False
+    assert _is_morphological_variant("cat", "catalyst") == False  # Too different in length
+
+    # Y→I transformations (INS-001.2 bug fix)
+    assert _is_morphological_variant("mystery", "mysteries") == True
+    assert _is_morphological_variant("mystery", "mysterious") == True
+    assert _is_morphological_variant("mystery", "mysteriously") == True  # Chained suffixes
+
+    # Prefix variants (INS-001.2 bug fix)
+    assert _is_morphological_variant("certainty", "uncertainty") == True
+    assert _is_morphological_variant("certain", "uncertain") == True
+    assert _is_morphological_variant("certainty", "uncertain") == True  # Prefix + suffix
+    assert _is_morphological_variant("happy", "unhappy") == True
+    assert _is_morphological_variant("possible", "impossible") == True
+    assert _is_morphological_variant("agree", "disagree") == True
+    # Long prefix: different first letter and length gap > 6, still a variant
+    assert _is_morphological_variant("counterbalance", "balance") == True
+
+    # Latin root variants (INS-001.2 statistical union fix)
+    # legislation family - all share "legisl" root
+    assert _is_morphological_variant("legislation", "legislative") == True
+    assert _is_morphological_variant("legislation", "legislature") == True
+    assert _is_morphological_variant("legislation", "legislate") == True
+    assert _is_morphological_variant("legislative", "legislature") == True
+    assert _is_morphological_variant("legislative", "legislate") == True
+    # maximum family - both stem to "maxim"
+    assert _is_morphological_variant("maximum", "maximal") == True
+
+    # Non-variants should still return False
+    assert _is_morphological_variant("mystery", "assurance") == False
+    assert _is_morphological_variant("certainty", "doubtless") == False
+    assert _is_morphological_variant("law", "legislation") == False  # Different roots
+    assert _is_morphological_variant("maximum", "minimum") == False  # Different roots
+
+
+def test_word_stem():
+    """Test word stemming."""
+    assert _get_word_stem("running") == "runn"
+    assert _get_word_stem("cats") == "cat"
+    assert _get_word_stem("happiness") == "happi"
+    # Latin-derived suffixes
+    assert _get_word_stem("legislation") == "legisl"
+    assert _get_word_stem("legislative") == "legislat"
+    assert _get_word_stem("legislature") == "legisla"
+    assert _get_word_stem("legislate") == "legisl"
+    assert _get_word_stem("maximum") == "maxim"
+    assert _get_word_stem("maximal") == "maxim"
+
+
+def test_normalize_stem():
+    """Test stem normalization for Y→I handling."""
+    assert _normalize_stem("mystery") == "myster"
+    assert _normalize_stem("mysteries") == "myster"
+    assert _normalize_stem("mysterious") == "myster"
+    assert _normalize_stem("mysteriously") == "myster"  # Chained suffixes
+
+
+def test_reconstruction():
+    """Test reconstruction scoring picks the better guess ordering."""
+    anchor = [1.0, 0.0, 0.0]
+    target = [0.0, 1.0, 0.0]
+
+    result = calculate_reconstruction(anchor, target, anchor, target, "sun", "moon", "sun", "moon")
+    assert abs(result["overall"] - 100.0) < 0.001
+    assert result["order_swapped"] == False
+    assert result["exact_anchor_match"] == True
+    assert result["exact_target_match"] == True
+
+    # Guesses in reverse order should be detected as swapped
+    swapped = calculate_reconstruction(anchor, target, target, anchor, "sun", "moon", "moon", "sun")
+    assert abs(swapped["overall"] - 100.0) < 0.001
+    assert swapped["order_swapped"] == True
+
+    # Orthogonal guesses score zero
+    miss = calculate_reconstruction(anchor, target, [0.0, 0.0, 1.0], [0.0, 0.0, 1.0], "sun", "moon", "a", "b")
+    assert miss["overall"] < 0.001
+    assert miss["exact_anchor_match"] == False
+
+
+def test_bridge_similarity():
+    """Test centroid similarity and path alignment of two clue sets."""
+    anchor = [1.0, 0.0, 0.0]
+    target = [0.0, 1.0, 0.0]
+    sender = [[0.5, 0.5, 1.0], [0.5, 0.5, 0.8]]
+    recipient = [[0.5, 0.5, 0.9]]
+
+    result = calculate_bridge_similarity(sender, recipient, anchor, target)
+    assert result["centroid_similarity"] > 99.0
+    assert abs(result["path_alignment"] - 1.0) < 0.001
+
+    # Clues on opposite sides of the anchor-target line
+    opposite = calculate_bridge_similarity(sender, [[0.5, 0.5, -0.9]], anchor, target)
+    assert abs(opposite["path_alignment"] + 1.0) < 0.001
+
+    # Empty clue sets
+    empty = calculate_bridge_similarity([], recipient)
+    assert empty["overall"] == 0.0
+    assert empty["path_alignment"] is None
+
+
+def test_affix_regexes_match_table_scan():
+    """Test compiled suffix/prefix regexes agree with scanning the tables in order."""
+    def stem_by_scan(word):
+        for suffix in _STEM_SUFFIXES:
+            if word.endswith(suffix) and len(word) > len(suffix) + 2:
+                return word[:-len(suffix)]
+        return word
+
+    def strip_by_scan(word):
+        word = word.lower()
+        for prefix in _STRIP_PREFIXES:
+            if word.startswith(prefix) and len(word) > len(prefix) + 3:
+                return word[len(prefix):]
+        return word
+
+    words = [
+        "cats", "cats\n", "running", "happiness", "legislative", "counterbalance",
+        "unhappy", "unhappy\n", "unit", "unit\n", "under", "understand",
+        "reason", "preview", "s", "ss", "sss", "", "\n", "us\n",
+    ]
+    for word in words:
+        assert _get_word_stem(word) == stem_by_scan(word), repr(word)
+        assert _strip_common_prefixes(word) == strip_by_scan(word), repr(word)
+
+    # "$" would also match before a trailing newline
+    assert _get_word_stem("cats\n") == "cats\n"
+
+
+def test_strip_prefixes():
+    """Test prefix stripping."""
+    assert _strip_common_prefixes("uncertainty") == "certainty"
+    assert _strip_common_prefixes("unhappy") == "happy"
+    assert _strip_common_prefixes("impossible") == "possible"
+    assert _strip_common_prefixes("disagree") == "agree"
+    # Should not strip if result would be too short
+    assert _strip_common_prefixes("unit") == "unit"
+
+
+def test_filter_union_candidates():
+    """Test greedy union selection with variant filtering."""
+    candidates = ["Ocean", "oceans", "mystery", "mysteries", "river", "wave", "waves"]
+    union, filtered = _filter_union_candidates(candidates, "ocean", "mystery", 2)
+    # Anchor/target and their variants are skipped, as are variants of picks
+    assert union == ["river", "wave"]
+    assert filtered == 4
+
+    # Stops as soon as enough words are selected
+    union, filtered = _filter_union_candidates(candidates, "sky", "tree", 1)
+    assert union == ["Ocean"]
+    assert filtered == 0
+
+
+def test_vector_literal():
+    """Test compact pgvector literal is lossless at float32 precision."""
+    assert _vector_literal([0.0, 1.0, -0.5]) == "[0.0,1.0,-0.5]"
+
+    rng = np.random.default_rng(0)
+    embedding = (rng.standard_normal(1536) * 0.03).tolist()
+    parsed = np.asarray(json.loads(_vector_literal(embedding)), dtype=np.float32)
+    assert np.array_equal(parsed, np.asarray(embedding, dtype=np.float32))
+
+
+def test_deprecated_scorers_accept_ndarrays():
+    """Test deprecated bridging scorers take (N, D) arrays as well as lists."""
+    rng = np.random.default_rng(1)
+    anchor, target = rng.standard_normal((2, 8))
+    clues = rng.standard_normal((3, 8))
+
+    assert calculate_binding_strength(anchor, target, clues) == calculate_binding_strength(
+        anchor.tolist(), target.tolist(), clues.tolist()
+    )
+    assert calculate_binding_strength(anchor, target, np.empty((0, 8))) == 0.0
+
+    result = calculate_bridge_similarity(clues, clues[::-1], anchor, target)
+    assert result == calculate_bridge_similarity(
+        clues.tolist(), clues[::-1].tolist(), anchor.tolist(), target.tolist()
+    )
+
+
+def test_deprecated_functions_warn_once():
+    """Test bridging deprecations go through scoring's shared warn-once helper."""
+    scoring._deprecation_warned.discard("calculate_semantic_distance")
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        calculate_semantic_distance([1.0, 0.0], [0.0, 1.0])
+        calculate_semantic_distance([1.0, 0.0], [0.0, 1.0])
+
+    assert [w.category for w in caught] == [DeprecationWarning]
+    assert "calculate_semantic_distance" in scoring._deprecation_warned